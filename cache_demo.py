@@ -7,12 +7,21 @@ It shows cache hits/misses and performance improvements.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from slideshow.transitions.ffmpeg_cache import FFmpegCache
-from slideshow.transitions.utils import extract_frame
+
+def _timed(func, *args, **kwargs):
+    """Call func and return (result, elapsed seconds) using the monotonic ns clock."""
+    t0 = time.perf_counter_ns()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter_ns() - t0) / 1e9
 
 def demo_cache():
     """Demonstrate the FFmpeg cache functionality."""
+    # Imported here so importing this module stays cheap (pulls in PIL/numpy)
+    from slideshow.transitions.utils import extract_frame
+    
     print("=== FFmpeg Cache Demo ===\n")
     
     # Initialize cache in output folder structure
@@ -24,56 +33,68 @@ def demo_cache():
     stats = FFmpegCache.get_cache_stats()
     print(f"Initial cache stats: {stats}\n")
     
-    # Find a video file for testing
-    test_video = None
-    for video_path in Path("data/slides").glob("*.MOV"):
-        if video_path.exists():
-            test_video = video_path
-            break
-    
-    if not test_video:
+    # Find video files for testing (first one is used for the single-file timings)
+    videos = sorted(Path("data/slides").glob("*.MOV"))[:8]
+    if not videos:
         print("No test video found in data/slides/")
         return
+    test_video = videos[0]
     
     print(f"Testing with video: {test_video.name}\n")
     
+    # Warm-up: a last-frame extraction (different cache key) pulls the ffmpeg
+    # binary and the video into the OS page cache before anything is timed
+    print("🔄 Warm-up extraction (last frame)...")
+    _, cold_duration = _timed(extract_frame, test_video, last=True)
+    print(f"✅ Completed in {cold_duration:.3f}s")
+    
     # First extraction (should miss cache)
-    print("🔄 First frame extraction (cache miss expected)...")
-    start_time = time.time()
-    frame1 = extract_frame(test_video, last=False)
-    first_duration = time.time() - start_time
-    print(f"✅ Completed in {first_duration:.2f}s - Frame size: {frame1.size}")
+    print("\n🔄 First frame extraction (cache miss expected)...")
+    frame1, first_duration = _timed(extract_frame, test_video, last=False)
+    print(f"✅ Completed in {first_duration:.3f}s - Frame size: {frame1.size}")
     
     # Second extraction (should hit cache)
     print("\n🔄 Second frame extraction (cache hit expected)...")
-    start_time = time.time()
-    frame2 = extract_frame(test_video, last=False)
-    second_duration = time.time() - start_time
-    print(f"✅ Completed in {second_duration:.2f}s - Frame size: {frame2.size}")
+    frame2, second_duration = _timed(extract_frame, test_video, last=False)
+    print(f"✅ Completed in {second_duration:.3f}s - Frame size: {frame2.size}")
+    
+    print(f"\nTimings (cold, warm miss, hit): "
+          f"({cold_duration:.3f}s, {first_duration:.3f}s, {second_duration:.3f}s)")
     
-    # Calculate speedup
+    # Calculate speedup against the warm miss, so page-cache effects don't inflate it
     if second_duration > 0:
         speedup = first_duration / second_duration
-        print(f"\n🚀 Cache speedup: {speedup:.1f}x faster!")
+        print(f"🚀 Cache speedup: {speedup:.1f}x faster!")
+    
+    # Batch extraction across several videos, 4 at a time. ffmpeg runs as a
+    # subprocess, so threads overlap the work; the second pass is all hits.
+    print(f"\n🔄 Parallel extraction of {len(videos)} videos (4 workers)...")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for label in ("first pass", "cached pass"):
+            _, batch_duration = _timed(
+                lambda: list(executor.map(lambda v: extract_frame(v, last=False), videos)))
+            throughput = len(videos) / batch_duration if batch_duration > 0 else float("inf")
+            print(f"✅ {label}: {batch_duration:.3f}s - {throughput:.1f} frames/sec")
     
     # Show final cache stats
     final_stats = FFmpegCache.get_cache_stats()
     print(f"\nFinal cache stats: {final_stats}")
+    print(f"Hit rate: {final_stats['hit_rate_percent']}% - "
+          f"Evicted: {final_stats['evicted_mb']:.2f} MB")
     
-    # Show cache directory contents
-    cache_dir = Path(final_stats['cache_dir'])
-    if cache_dir.exists():
+    # Show cache directory contents (largest files first)
+    if Path(final_stats['cache_dir']).exists():
         print(f"\nCache directory contents:")
         for subdir in ['clips', 'frames']:
-            subpath = cache_dir / subdir
-            if subpath.exists():
-                files = list(subpath.glob("*"))
-                print(f"  {subdir}/: {len(files)} files")
-                for f in files[:3]:  # Show first 3 files
-                    size_mb = f.stat().st_size / (1024 * 1024)
-                    print(f"    - {f.name} ({size_mb:.2f} MB)")
-                if len(files) > 3:
-                    print(f"    ... and {len(files) - 3} more")
+            names, sizes = FFmpegCache.scan_cache_files(subdir)
+            if not names:
+                continue
+            total_mb = sum(sizes) / (1024 * 1024)
+            print(f"  {subdir}/: {len(names)} files ({total_mb:.2f} MB)")
+            for size, name in sorted(zip(sizes, names), reverse=True)[:3]:
+                print(f"    - {name} ({size / (1024 * 1024):.2f} MB)")
+            if len(names) > 3:
+                print(f"    ... and {len(names) - 3} more")
     
     print("\n=== Demo Complete ===")
 
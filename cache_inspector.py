@@ -4,12 +4,23 @@ Cache inspection utility for SlideShowBuilder FFmpeg cache.
 Shows the mapping between cached files and their source slides.
 """
 
+import argparse
 import sys
+from collections import defaultdict
 from pathlib import Path
 from slideshow.transitions.ffmpeg_cache import FFmpegCache
 
-def inspect_cache(cache_dir=None):
-    """Inspect and display cache contents with source file mappings."""
+def _display_order(entry):
+    """Sort key: clips by sequence position, then frames by cached file mtime"""
+    if entry["type"] == "clip":
+        return (0, entry["sequence_pos"], entry["sequence_sub"])
+    return (1, entry["cached_file_mtime"], 0)
+
+def inspect_cache(cache_dir=None, limit_mb=None):
+    """Inspect and display cache contents with source file mappings.
+    
+    If limit_mb is given, the cache is first trimmed to that size.
+    """
     
     if cache_dir is None:
         cache_dir = Path("data/output/working/ffmpeg_cache")
@@ -20,7 +31,8 @@ def inspect_cache(cache_dir=None):
     print("=" * 60)
     
     # Initialize cache
-    FFmpegCache.initialize(cache_dir)
+    max_bytes = int(limit_mb * 1024 * 1024) if limit_mb is not None else None
+    FFmpegCache.initialize(cache_dir, max_bytes=max_bytes)
     
     # Get basic stats
     stats = FFmpegCache.get_cache_stats()
@@ -34,25 +46,29 @@ def inspect_cache(cache_dir=None):
     print(f"  Extracted Frames: {stats['frame_count']}")
     print(f"  Total Size: {stats['total_size_mb']:.1f} MB")
     print(f"  Hit Rate: {stats.get('hit_rate_percent', 0)}%")
+    print(f"  Evicted: {stats.get('evicted_mb', 0):.1f} MB")
     print()
     
-    # Get detailed entries
-    cache_data = FFmpegCache.get_cache_entries_with_sources()
-    entries = cache_data.get("entries", [])
+    # Group entries by operation type, streaming them from the cache. Like
+    # get_cache_entries_with_sources(), list only clips and frames and leave
+    # out intro title clips
+    operations = defaultdict(list)
+    for entry in FFmpegCache.iter_cache_entries_with_sources():
+        if entry["type"] not in ("clip", "frame"):
+            continue
+        if entry["type"] == "clip" and entry["operation"] == "intro_title_render":
+            continue
+        operations[entry["operation"]].append(entry)
     
-    if not entries:
+    if not operations:
         print("No cache entries found.")
         return
     
-    # Group by operation type
-    operations = {}
-    for entry in entries:
-        op = entry["operation"]
-        if op not in operations:
-            operations[op] = []
-        operations[op].append(entry)
-    
-    for operation, op_entries in operations.items():
+    # Same order as get_cache_entries_with_sources(): clips in concatenation
+    # order, then frames by creation time; groups in order of their first entry
+    for op_entries in operations.values():
+        op_entries.sort(key=_display_order)
+    for operation, op_entries in sorted(operations.items(), key=lambda item: _display_order(item[1][0])):
         print(f"\\n{operation.upper()} Operations ({len(op_entries)} entries):")
         print("-" * 40)
         
@@ -72,12 +88,15 @@ def inspect_cache(cache_dir=None):
             print()
 
 def main():
-    cache_dir = None
-    if len(sys.argv) > 1:
-        cache_dir = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Inspect the SlideShowBuilder FFmpeg cache.")
+    parser.add_argument("cache_dir", nargs="?", default=None,
+                        help="Cache directory (default: data/output/working/ffmpeg_cache)")
+    parser.add_argument("--limit", type=float, metavar="MB", default=None,
+                        help="Cap the cache at this size, evicting entries if it is larger")
+    args = parser.parse_args()
     
     try:
-        inspect_cache(cache_dir)
+        inspect_cache(args.cache_dir, args.limit)
     except Exception as e:
         print(f"Error inspecting cache: {e}")
         sys.exit(1)
@@ -1,7 +1,192 @@
+import atexit
+from collections import OrderedDict
+import copy
 import json
+import mmap
 from pathlib import Path
 import os
+import pickle
+import sys
 import threading
+import types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - fall back to stdlib json
+
+
+def _json_loads(data):
+    """Parse JSON bytes (or a bytes-like buffer) with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+# Reused by the stdlib fallback; json.dumps() builds a new encoder per call
+# whenever options are passed. ensure_ascii=False matches orjson's raw UTF-8.
+_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to indented, key-sorted UTF-8 JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+# ============================================================================
+# ConfigStore - the one place config JSON files are read and written
+# ============================================================================
+
+class ConfigStore:
+    """
+    Shared JSON file store for project configs and app settings.
+    
+    Reads keep the last parse of each file and reuse it while the file's
+    mtime and size are unchanged. Saves are serialized right away but written
+    after a short debounce, so rapid saves to the same file coalesce into one
+    atomic write (temp file + fsync + rename).
+    
+    Config and AppSettings both go through this class, so file format and
+    I/O behaviour only need to change here.
+    """
+    
+    SAVE_DEBOUNCE_SECONDS = 0.25
+    MMAP_THRESHOLD_BYTES = 4096  # Files larger than this are parsed via mmap
+    
+    # Maps file path -> (st_mtime_ns, st_size, parsed data)
+    _cache: dict = {}
+    _cache_lock = threading.Lock()
+    
+    # Maps file path -> serialized JSON bytes waiting to be written
+    _pending: dict = {}
+    _pending_lock = threading.Lock()
+    _flush_lock = threading.Lock()
+    _flush_timer = None
+    
+    @classmethod
+    def load(cls, path: Path, max_bytes: int = None):
+        """Parse a JSON file, reusing the previous parse while mtime and size are unchanged.
+        
+        Costs one stat() per call on a hit. Returns a deep copy so callers can
+        mutate the result freely. A queued save for path is written first.
+        
+        Raises:
+            OSError: If the file is missing, unreadable or larger than max_bytes
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        cls.flush(path)
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        with cls._cache_lock:
+            cached = cls._cache.get(path)
+        if cached is not None and cached[:2] == signature:
+            return copy.deepcopy(cached[2])
+        
+        if max_bytes is not None and st.st_size > max_bytes:
+            raise OSError(f"Config file too large ({st.st_size} bytes, max {max_bytes} bytes)")
+        
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > cls.MMAP_THRESHOLD_BYTES:
+                # Parse straight from the page cache instead of copying into a bytes object
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = _json_loads(view)
+            else:
+                data = _json_loads(f.read())
+        with cls._cache_lock:
+            cls._cache[path] = (signature[0], signature[1], data)
+        return copy.deepcopy(data)
+    
+    @classmethod
+    def save(cls, path: Path, data: dict):
+        """Queue data to be written to path, restarting the debounce timer."""
+        payload = _json_dumps(data)
+        with cls._pending_lock:
+            cls._pending[path] = payload
+            if cls._flush_timer is not None:
+                cls._flush_timer.cancel()
+            cls._flush_timer = threading.Timer(cls.SAVE_DEBOUNCE_SECONDS, cls.flush)
+            cls._flush_timer.daemon = True
+            cls._flush_timer.start()
+        cls.invalidate(path)
+    
+    @classmethod
+    def flush(cls, path: Path = None):
+        """Write queued saves to disk now - all of them, or only the one for path."""
+        with cls._flush_lock:
+            with cls._pending_lock:
+                if path is None:
+                    pending = dict(cls._pending)
+                    cls._pending.clear()
+                    if cls._flush_timer is not None:
+                        cls._flush_timer.cancel()
+                        cls._flush_timer = None
+                elif path in cls._pending:
+                    pending = {path: cls._pending.pop(path)}
+                else:
+                    return
+            for target, payload in pending.items():
+                try:
+                    cls._write_atomic(target, payload)
+                    st = target.stat()
+                except OSError as e:
+                    print(f"[Config] WARNING: Failed to save to {target} ({e})")
+                    cls.invalidate(target)
+                    continue
+                # Seed the parse cache with what was just written, so the next
+                # load() of this file is a stat() instead of a read. Parsing the
+                # payload (rather than keeping the caller's dict) matches exactly
+                # what a read from disk would return.
+                with cls._cache_lock:
+                    cls._cache[target] = (st.st_mtime_ns, st.st_size, _json_loads(payload))
+    
+    @staticmethod
+    def _write_atomic(path: Path, payload: bytes):
+        """Write payload to a temp file, fsync it, then rename it over path."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            f = open(tmp_path, "wb")
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp_path, "wb")
+        with f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def invalidate(cls, path: Path):
+        """Drop the cached parse for path."""
+        with cls._cache_lock:
+            cls._cache.pop(path, None)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Forget all cached parses (mainly for testing)."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+
+def clear_config_cache():
+    """Forget all cached config file parses (mainly for testing)."""
+    ConfigStore.clear_cache()
+
+
+def flush_config_writes():
+    """Write all queued config/app settings saves to disk immediately.
+    
+    Called automatically when the debounce timer fires and at interpreter
+    exit; call it directly when the files must be on disk right away.
+    """
+    ConfigStore.flush()
+
+
+atexit.register(flush_config_writes)
 
 # ============================================================================
 # Config Singleton - Global Configuration Class
@@ -79,29 +264,68 @@ class Config:
         "hardware_acceleration": False,
         "temp_directory": "",
         "auto_cleanup": True,
-        "keep_intermediate_frames": False
+        "keep_intermediate_frames": False,
+        "ffmpeg_cache_max_mb": 4096
     }
     
-    # FFmpeg encoding quality presets
-    FFMPEG_ENCODING_PRESETS = {
+    # Pickled templates - unpickling gives a true deep copy of the defaults
+    # (nested intro_title dicts/lists included) faster than copy.deepcopy()
+    _DEFAULT_APP_SETTINGS_BLOB = pickle.dumps(DEFAULT_APP_SETTINGS, protocol=5)
+    _DEFAULT_CONFIG_BLOB = pickle.dumps(DEFAULT_CONFIG, protocol=5)
+    
+    # The shared defaults are read-only; use default_config() /
+    # default_app_settings() for a copy that can be modified
+    DEFAULT_APP_SETTINGS = types.MappingProxyType(DEFAULT_APP_SETTINGS)
+    DEFAULT_CONFIG = types.MappingProxyType(DEFAULT_CONFIG)
+    
+    # FFmpeg encoding quality presets (read-only)
+    # vt_bitrate is the VideoToolbox average bitrate (it has no CRF mode)
+    FFMPEG_ENCODING_PRESETS = types.MappingProxyType({
         "maximum": {
-            "crf": "18", "preset": "slow", "profile": "high", "level": "4.1",
+            "crf": "18", "preset": "slow", "profile": "high", "level": "4.1", "vt_bitrate": "20M",
             "description": "Maximum quality - visually lossless, ~18-25 Mbps"
         },
         "high": {
-            "crf": "20", "preset": "medium", "profile": "high", "level": "4.1",
+            "crf": "20", "preset": "medium", "profile": "high", "level": "4.1", "vt_bitrate": "15M",
             "description": "High quality - excellent balance, ~12-18 Mbps"
         },
         "medium": {
-            "crf": "23", "preset": "medium", "profile": "main", "level": "4.0",
+            "crf": "23", "preset": "medium", "profile": "main", "level": "4.0", "vt_bitrate": "10M",
             "description": "Medium quality - good compression, ~8-12 Mbps"
         },
         "fast": {
-            "crf": "25", "preset": "fast", "profile": "main", "level": "4.0",
+            "crf": "25", "preset": "fast", "profile": "main", "level": "4.0", "vt_bitrate": "6M",
             "description": "Fast encoding - smaller files, ~5-8 Mbps"
         }
+    })
+    
+    # FFmpeg arguments per preset, built once since they never change at runtime
+    _ENCODE_ARGS = {
+        name: ("-c:v", "libx264",
+               "-preset", p["preset"],
+               "-crf", p["crf"],
+               "-profile:v", p["profile"],
+               "-level", p["level"])
+        for name, p in FFMPEG_ENCODING_PRESETS.items()
+    }
+    _VIDEOTOOLBOX_ENCODE_ARGS = {
+        name: ("-c:v", "h264_videotoolbox",
+               "-b:v", p["vt_bitrate"],
+               "-profile:v", p["profile"],
+               "-level", p["level"])
+        for name, p in FFMPEG_ENCODING_PRESETS.items()
     }
     
+    @classmethod
+    def default_config(cls) -> dict:
+        """Return a fresh deep copy of DEFAULT_CONFIG that is safe to mutate."""
+        return pickle.loads(cls._DEFAULT_CONFIG_BLOB)
+    
+    @classmethod
+    def default_app_settings(cls) -> dict:
+        """Return a fresh deep copy of DEFAULT_APP_SETTINGS that is safe to mutate."""
+        return pickle.loads(cls._DEFAULT_APP_SETTINGS_BLOB)
+    
     # =================================================================
     # Input Validation Methods
     # =================================================================
@@ -263,12 +487,26 @@ class Config:
     
     @classmethod
     def instance(cls):
-        """Get the singleton instance (thread-safe)."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance (thread-safe).
+        
+        The instance is created when this module is imported (see cfg below),
+        so normally this is a single attribute load; the locked path only
+        runs if the instance has been reset (tests).
+        """
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    @classmethod
+    def _detached(cls, config: dict) -> "Config":
+        """Create a throwaway Config around config without touching the singleton."""
+        detached = object.__new__(cls)
+        detached._config = config
+        return detached
     
     # =================================================================
     # Project Configuration Methods
@@ -287,7 +525,7 @@ class Config:
             print(f"[Config] WARNING: Invalid configuration parameter: {e}")
             print(f"[Config] Using defaults for invalid parameters")
             # Fall back to using defaults for invalid parameters
-            self._config = self.DEFAULT_CONFIG.copy()
+            self._config = self.default_config()
             # Try to merge valid parameters one by one
             for key, value in config.items():
                 try:
@@ -311,7 +549,7 @@ class Config:
     def update(self, updates: dict):
         """Update configuration with new values, with validation."""
         if self._config is None:
-            self._config = self.DEFAULT_CONFIG.copy()
+            self._config = self.default_config()
         
         # Validate updates before applying
         try:
@@ -347,7 +585,7 @@ class Config:
         Load project config from disk and set as current config.
         If output_folder not specified, tries to load from last project.
         """
-        config = self.DEFAULT_CONFIG.copy()
+        config = self.default_config()
         
         # Determine config path
         if output_folder:
@@ -359,34 +597,28 @@ class Config:
                 return config
         else:
             # Try to load from last project
-            app_settings = self.load_app_settings()
+            app_settings = AppSettings.instance()
             last_project = app_settings.get("last_project_path", "")
             config_path = self._resolve_startup_config_path(last_project, app_settings)
         
-        if config_path.exists():
-            try:
-                size = config_path.stat().st_size
-                if size > self.MAX_CONFIG_BYTES:
-                    raise OSError(
-                        f"Config file too large ({size} bytes, "
-                        f"max {self.MAX_CONFIG_BYTES} bytes)"
-                    )
-                with open(config_path, "r") as f:
-                    user_config = json.load(f)
-                    if isinstance(user_config, dict):
-                        # Apply user config values one by one with validation
-                        for key, value in user_config.items():
-                            if key in config:  # Only update existing keys
-                                try:
-                                    # Test the value by creating a temporary config
-                                    temp_config = {key: value}
-                                    validated_temp = self._validate_config_dict(temp_config)
-                                    config[key] = validated_temp[key]
-                                except ValueError as e:
-                                    print(f"[Config] WARNING: Ignoring invalid config value {key}={value}: {e}")
-                                    # Keep the default value
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"[Config] WARNING: Failed to load from {config_path} ({e}), using defaults.")
+        try:
+            user_config = ConfigStore.load(config_path, max_bytes=self.MAX_CONFIG_BYTES)
+            if isinstance(user_config, dict):
+                # Apply user config values one by one with validation
+                for key, value in user_config.items():
+                    if key in config:  # Only update existing keys
+                        try:
+                            # Test the value by creating a temporary config
+                            temp_config = {key: value}
+                            validated_temp = self._validate_config_dict(temp_config)
+                            config[key] = validated_temp[key]
+                        except ValueError as e:
+                            print(f"[Config] WARNING: Ignoring invalid config value {key}={value}: {e}")
+                            # Keep the default value
+        except FileNotFoundError:
+            pass  # No saved config yet - use defaults
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"[Config] WARNING: Failed to load from {config_path} ({e}), using defaults.")
         
         self.set(config)
         return config
@@ -406,7 +638,7 @@ class Config:
         # Handle saved project-folder paths (.../Project).
         return path / self.PROJECT_CONFIG_FILE
 
-    def _resolve_startup_config_path(self, last_project_path: str, app_settings: dict) -> Path:
+    def _resolve_startup_config_path(self, last_project_path: str, app_settings: "AppSettings") -> Path:
         """Resolve config path at startup, preferring last project then history entries."""
         if last_project_path:
             normalized = self._normalize_config_path(last_project_path)
@@ -431,8 +663,7 @@ class Config:
 
                 if candidate.exists():
                     # Heal last_project_path for future launches.
-                    app_settings["last_project_path"] = str(candidate)
-                    self.save_app_settings(app_settings)
+                    app_settings.set("last_project_path", str(candidate))
                     return candidate
 
         return Path(self.PROJECT_CONFIG_FILE)
@@ -455,48 +686,47 @@ class Config:
         except ValueError as e:
             print(f"[Config] ERROR: Invalid output folder path: {e}")
             return
-        is_new_folder = not config_path.parent.exists()
+        # Ensure project folder exists. One mkdir also tells us whether the
+        # folder is new, saving exists() round-trips on network volumes.
+        project_folder = config_path.parent
+        try:
+            project_folder.mkdir(parents=True, exist_ok=False)
+            is_new_folder = True
+        except FileExistsError:
+            is_new_folder = False
         
         # Check if parent folder is actually a file (corruption from old bug)
-        if config_path.parent.exists() and config_path.parent.is_file():
-            print(f"[Config] ERROR: Found file where project folder should be: {config_path.parent}")
+        if not is_new_folder and project_folder.is_file():
+            print(f"[Config] ERROR: Found file where project folder should be: {project_folder}")
             print(f"[Config] This is likely due to a previous bug. Attempting to fix...")
             # The file is probably an old config file in the wrong place
             # Move it aside temporarily
-            backup_path = config_path.parent.parent / f"{config_path.parent.name}.backup"
-            config_path.parent.rename(backup_path)
+            backup_path = project_folder.parent / f"{project_folder.name}.backup"
+            project_folder.rename(backup_path)
             print(f"[Config] Moved corrupted file to: {backup_path}")
-        
-        # Ensure project folder exists
-        try:
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-        except FileExistsError as e:
-            print(f"[Config] ERROR: Failed to create project folder: {e}")
-            raise
+            try:
+                project_folder.mkdir(parents=True, exist_ok=True)
+            except FileExistsError as e:
+                print(f"[Config] ERROR: Failed to create project folder: {e}")
+                raise
         
         # Create output folder and cache structure for new folders
         if is_new_folder:
-            output_path = Path(output_folder)
-            output_path.mkdir(parents=True, exist_ok=True)
-            cache_dir = output_path / "working" / "ffmpeg_cache"
+            cache_dir = Path(output_folder) / "working" / "ffmpeg_cache"
             cache_dir.mkdir(parents=True, exist_ok=True)
             print(f"[Config] Created project folder structure with cache at: {cache_dir}")
         
-        # Merge with defaults and save
-        merged = self.DEFAULT_CONFIG.copy()
-        merged.update(self._config)
+        # Merge with defaults and save. Loaded/validated configs already hold
+        # every default key, so usually only missing keys need filling in.
+        merged = dict(self._config)
+        for key in self.DEFAULT_CONFIG.keys() - merged.keys():
+            merged[key] = copy.deepcopy(self.DEFAULT_CONFIG[key])
         
-        try:
-            with open(config_path, "w") as f:
-                json.dump(merged, f, indent=2)
-            
-            # Update app settings to remember this project
-            app_settings = self.load_app_settings()
-            app_settings["last_project_path"] = str(config_path)
-            self.save_app_settings(app_settings)
-            
-        except OSError as e:
-            print(f"[Config] WARNING: Failed to save to {config_path} ({e})")
+        # Both writes are queued and land together in one debounced flush
+        ConfigStore.save(config_path, merged)
+        
+        # Update app settings to remember this project
+        AppSettings.instance().set("last_project_path", str(config_path))
     
     def _get_project_config_path(self, output_folder: str) -> Path:
         """Get the path to the project config file.
@@ -536,7 +766,6 @@ class Config:
     @staticmethod
     def _get_platform_font_paths() -> list:
         """Get default font search paths for the current OS."""
-        import sys
         if sys.platform == "darwin":
             return [
                 "/System/Library/Fonts/Arial.ttf",
@@ -561,7 +790,6 @@ class Config:
     @staticmethod
     def _get_platform_font_dirs() -> list:
         """Get default font directories for the current OS."""
-        import sys
         if sys.platform == "darwin":
             return ["/System/Library/Fonts", "/Library/Fonts", "/System/Library/Fonts/Supplemental"]
         elif sys.platform == "win32":
@@ -573,7 +801,6 @@ class Config:
     @staticmethod
     def _get_platform_ffmpeg_search_paths() -> list:
         """Get OS-specific paths to search for ffmpeg/ffprobe."""
-        import sys
         if sys.platform == "darwin":
             return ["/usr/local/bin", "/opt/homebrew/bin", "/usr/bin"]
         elif sys.platform == "win32":
@@ -590,7 +817,7 @@ class Config:
         Returns:
             Path to a usable font file, or empty string if none found.
         """
-        settings = self.load_app_settings()
+        settings = AppSettings.instance()
         configured = settings.get("default_font_path", "")
         if configured and Path(configured).exists():
             return configured
@@ -610,8 +837,7 @@ class Config:
         Returns:
             List of font file paths to try in order.
         """
-        import sys
-        settings = self.load_app_settings()
+        settings = AppSettings.instance()
         
         # Start with user-configured extra font directories
         extra_dirs = settings.get("font_search_paths", [])
@@ -667,7 +893,7 @@ class Config:
 
     def get_font_initial_dir(self) -> str:
         """Get a sensible initial directory for font file browser dialogs."""
-        settings = self.load_app_settings()
+        settings = AppSettings.instance()
         
         # Use configured font's directory if available
         configured = settings.get("default_font_path", "")
@@ -695,7 +921,7 @@ class Config:
         Returns:
             List of directory paths to search.
         """
-        settings = self.load_app_settings()
+        settings = AppSettings.instance()
         result = []
 
         # User-configured paths first (from ffmpeg_path setting directory)
@@ -722,7 +948,7 @@ class Config:
         Returns:
             Configured path string, or empty string if not set.
         """
-        settings = self.load_app_settings()
+        settings = AppSettings.instance()
         key = f"{name}_path"
         return settings.get(key, "")
 
@@ -731,19 +957,12 @@ class Config:
     # =================================================================
     
     def load_app_settings(self) -> dict:
-        """Load global app settings from ~/SlideShowBuilder/slideshow_settings.json"""
-        settings = self.DEFAULT_APP_SETTINGS.copy()
+        """Load global app settings from ~/SlideShowBuilder/slideshow_settings.json
         
-        if self.APP_SETTINGS_FILE.exists():
-            try:
-                with open(self.APP_SETTINGS_FILE, "r") as f:
-                    user_settings = json.load(f)
-                    if isinstance(user_settings, dict):
-                        settings.update(user_settings)
-            except (json.JSONDecodeError, OSError) as e:
-                print(f"[Config] WARNING: Failed to load app settings ({e}), using defaults")
-        
-        return settings
+        Returns a copy of the in-memory AppSettings merged with defaults; the
+        file itself is only read once.
+        """
+        return AppSettings.instance().get_all()
     
     def save_app_settings(self, settings: dict):
         """Save global app settings to ~/SlideShowBuilder/slideshow_settings.json
@@ -751,14 +970,33 @@ class Config:
         Only writes keys that are already present in the passed-in settings dict.
         New default keys are available in memory via load_app_settings() but won't
         be injected into the file until explicitly set by the user or app logic.
+        
+        The write is debounced; use flush_config_writes() to force it to disk.
         """
-        self.APP_SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
+        AppSettings.instance().replace(settings)
+    
+    @staticmethod
+    def _project_history_map(history) -> OrderedDict:
+        """Normalize stored project history into an OrderedDict of name -> path.
         
-        try:
-            with open(self.APP_SETTINGS_FILE, "w") as f:
-                json.dump(settings, f, indent=2)
-        except OSError as e:
-            print(f"[Config] WARNING: Failed to save app settings ({e})")
+        Accepts the old format (plain name strings, default path) as well as
+        {"name", "path"} dicts. Invalid entries, blank names and later
+        duplicates are dropped; order is preserved (most recent first).
+        """
+        projects = OrderedDict()
+        if not isinstance(history, list):
+            return projects
+        for entry in history:
+            if isinstance(entry, str):
+                # Old format: just a string name, assume default path
+                name, path = entry, ""
+            elif isinstance(entry, dict) and "name" in entry:
+                name, path = entry["name"], entry.get("path", "")
+            else:
+                continue
+            if name and name.strip():
+                projects.setdefault(name, path)
+        return projects
     
     def add_to_project_history(self, project_name: str, project_path: str = None):
         """Add project to history (most recent first, max 10).
@@ -770,41 +1008,20 @@ class Config:
         if not project_name or not project_name.strip():
             return
         
-        settings = self.load_app_settings()
-        history = settings.get("project_history", [])
-        
-        # Ensure history is a list
-        if not isinstance(history, list):
-            history = []
-        
-        # Normalize history entries - convert old string format to dict format
-        normalized_history = []
-        for entry in history:
-            if isinstance(entry, str):
-                # Old format: just a string name, assume default path
-                normalized_history.append({"name": entry, "path": ""})
-            elif isinstance(entry, dict) and "name" in entry:
-                # New format: dict with name and path
-                normalized_history.append(entry)
+        settings = AppSettings.instance()
+        projects = self._project_history_map(settings.get("project_history", []))
         
         # Determine project path
         if project_path is None:
             project_path = ""  # Empty means default ~/SlideShowBuilder/
         
-        # Remove if already exists (to move to top)
-        normalized_history = [
-            entry for entry in normalized_history 
-            if entry["name"] != project_name
-        ]
-        
-        # Add to front
-        normalized_history.insert(0, {"name": project_name, "path": project_path})
+        # Add or move to front, keeping only the 10 most recent
+        projects[project_name] = project_path
+        projects.move_to_end(project_name, last=False)
+        while len(projects) > 10:
+            projects.popitem(last=True)
         
-        # Keep only last 10
-        normalized_history = normalized_history[:10]
-        
-        settings["project_history"] = normalized_history
-        self.save_app_settings(settings)
+        settings.set("project_history", [{"name": name, "path": path} for name, path in projects.items()])
     
     def get_project_history(self) -> list:
         """Get list of recent projects as dicts with 'name' and 'path' keys.
@@ -813,27 +1030,8 @@ class Config:
             List of dicts: [{"name": "ProjectName", "path": "/path/to/project"}, ...]
             Path may be empty string if using default ~/SlideShowBuilder/ location
         """
-        settings = self.load_app_settings()
-        history = settings.get("project_history", [])
-        
-        if not isinstance(history, list):
-            return []
-        
-        # Normalize history entries - convert old string format to dict format
-        normalized = []
-        for entry in history:
-            if isinstance(entry, str):
-                # Old format: just a string name, assume default path
-                normalized.append({"name": entry, "path": ""})
-            elif isinstance(entry, dict) and "name" in entry:
-                # New format: dict with name and path
-                # Ensure path key exists
-                path = entry.get("path", "")
-                name = entry["name"]
-                if name and name.strip():
-                    normalized.append({"name": name, "path": path})
-        
-        return normalized
+        projects = self._project_history_map(AppSettings.instance().get("project_history", []))
+        return [{"name": name, "path": path} for name, path in projects.items()]
     
     def get_project_history_names(self) -> list:
         """Get list of recent project names only (for backward compatibility).
@@ -841,14 +1039,13 @@ class Config:
         Returns:
             List of project name strings
         """
-        history = self.get_project_history()
-        return [entry["name"] for entry in history]
+        return list(self._project_history_map(AppSettings.instance().get("project_history", [])))
     
     # =================================================================
     # FFmpeg Encoding Methods
     # =================================================================
     
-    def get_ffmpeg_encoding_params(self, quality_preset: str = None) -> list:
+    def get_ffmpeg_encoding_params(self, quality_preset: str = None) -> tuple:
         """
         Get FFmpeg encoding parameters based on quality preset.
         
@@ -857,7 +1054,8 @@ class Config:
                           If None, uses current config["video_quality"]
         
         Returns:
-            List of FFmpeg command-line arguments
+            Tuple of FFmpeg command-line arguments (shared and immutable -
+            use cmd.extend(...) or *params, or list(...) to modify)
         """
         # Determine which preset to use
         if quality_preset:
@@ -867,39 +1065,15 @@ class Config:
         else:
             preset_name = "maximum"  # Default fallback
         
-        if preset_name not in self.FFMPEG_ENCODING_PRESETS:
+        if preset_name not in self._ENCODE_ARGS:
             raise ValueError(f"Unknown quality preset: {preset_name}. "
                            f"Valid: {list(self.FFMPEG_ENCODING_PRESETS.keys())}")
         
-        preset = self.FFMPEG_ENCODING_PRESETS[preset_name]
-        
         # Use hardware VideoToolbox encoder on macOS if enabled
-        use_hw = self.get("hardware_acceleration", False)
-        if use_hw:
-            import sys
-            if sys.platform == "darwin":
-                # VideoToolbox uses average bitrate instead of CRF
-                vt_bitrates = {
-                    "maximum": "20M",
-                    "high":    "15M",
-                    "medium":  "10M",
-                    "fast":    "6M",
-                }
-                bitrate = vt_bitrates.get(preset_name, "15M")
-                return [
-                    "-c:v", "h264_videotoolbox",
-                    "-b:v", bitrate,
-                    "-profile:v", preset["profile"],
-                    "-level", preset["level"],
-                ]
-        
-        return [
-            "-c:v", "libx264",
-            "-preset", preset["preset"],
-            "-crf", preset["crf"],
-            "-profile:v", preset["profile"],
-            "-level", preset["level"],
-        ]
+        if sys.platform == "darwin" and self.get("hardware_acceleration", False):
+            return self._VIDEOTOOLBOX_ENCODE_ARGS[preset_name]
+        
+        return self._ENCODE_ARGS[preset_name]
     
     def get_quality_description(self, quality_preset: str = None) -> str:
         """Get human-readable description of quality preset."""
@@ -909,6 +1083,110 @@ class Config:
         return "Unknown quality preset"
 
 
+# ============================================================================
+# AppSettings Singleton - Global App Settings
+# ============================================================================
+
+class AppSettings:
+    """
+    In-memory singleton for global app settings (project history, last project,
+    tool paths). The settings file is read once on first access; set() updates
+    the in-memory copy and queues a debounced write.
+    
+    Config.load_app_settings() / save_app_settings() go through this class.
+    
+    Usage:
+        history = AppSettings.instance().get("project_history")
+        AppSettings.instance().set("last_project_path", "/path/to/slideshow_config.json")
+    """
+    
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        if AppSettings._instance is not None:
+            raise RuntimeError("Use AppSettings.instance() instead of creating new instances")
+        self._settings_lock = threading.RLock()
+        self._path = None
+        self._stored = None  # Keys as stored on disk, without injected defaults
+    
+    @classmethod
+    def instance(cls):
+        """Get the singleton instance (thread-safe)."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
+    def _ensure_loaded(self):
+        """Read the settings file on first use or after the settings location changes."""
+        path = Config.APP_SETTINGS_FILE
+        if self._stored is not None and self._path == path:
+            return
+        
+        stored = {}
+        try:
+            user_settings = ConfigStore.load(path)
+            if isinstance(user_settings, dict):
+                stored = user_settings
+        except FileNotFoundError:
+            pass  # First run - use defaults
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"[Config] WARNING: Failed to load app settings ({e}), using defaults")
+        
+        self._path = path
+        self._stored = stored
+    
+    def get(self, key: str, default=None):
+        """Get a setting, falling back to DEFAULT_APP_SETTINGS, then default."""
+        with self._settings_lock:
+            self._ensure_loaded()
+            if key in self._stored:
+                value = self._stored[key]
+            elif key in Config.DEFAULT_APP_SETTINGS:
+                value = Config.DEFAULT_APP_SETTINGS[key]
+            else:
+                return default
+            return copy.deepcopy(value)
+    
+    def get_all(self) -> dict:
+        """Get a copy of all settings merged over the defaults."""
+        with self._settings_lock:
+            self._ensure_loaded()
+            settings = Config.default_app_settings()
+            settings.update(copy.deepcopy(self._stored))
+            return settings
+    
+    def set(self, key: str, value):
+        """Set a setting and queue it to be saved."""
+        with self._settings_lock:
+            self._ensure_loaded()
+            self._stored[key] = value
+            ConfigStore.save(self._path, self._stored)
+    
+    def replace(self, settings: dict):
+        """Replace all stored settings and queue them to be saved."""
+        with self._settings_lock:
+            self._path = Config.APP_SETTINGS_FILE
+            self._stored = copy.deepcopy(settings)
+            ConfigStore.save(self._path, self._stored)
+    
+    def reload(self):
+        """Discard the in-memory settings so the next access re-reads the file."""
+        with self._settings_lock:
+            self._stored = None
+
+
+# ============================================================================
+# Module-level convenience: Shorthand for Config.instance()
+# ============================================================================
+# Created eagerly at import so instance() and the wrappers below never take the lock.
+# Usage: from slideshow.config import cfg
+#        params = cfg.get_ffmpeg_encoding_params()
+cfg = Config.instance()
+
+
 # ============================================================================
 # Backward Compatibility Wrappers
 # ============================================================================
@@ -924,60 +1202,51 @@ PROJECT_CONFIG_FILE = Config.PROJECT_CONFIG_FILE
 APP_SETTINGS_DIR = Config.APP_SETTINGS_DIR
 APP_SETTINGS_FILE = Config.APP_SETTINGS_FILE
 
-def get_ffmpeg_encoding_params(quality_preset: str = None, config: dict = None) -> list:
+def get_ffmpeg_encoding_params(quality_preset: str = None, config: dict = None) -> tuple:
     """Backward compatibility wrapper. New code should use Config.instance().get_ffmpeg_encoding_params()"""
     if config:
-        # Create temp instance just for this call
-        temp_config = Config()
-        temp_config._config = config
-        return temp_config.get_ffmpeg_encoding_params(quality_preset)
-    return Config.instance().get_ffmpeg_encoding_params(quality_preset)
+        # Temp instance just for this call (Config() itself is reserved for the singleton)
+        return Config._detached(config).get_ffmpeg_encoding_params(quality_preset)
+    return cfg.get_ffmpeg_encoding_params(quality_preset)
 
 def get_quality_description(quality_preset: str = None) -> str:
     """Backward compatibility wrapper. New code should use Config.instance().get_quality_description()"""
-    return Config.instance().get_quality_description(quality_preset)
+    return cfg.get_quality_description(quality_preset)
 
 def load_app_settings() -> dict:
     """Backward compatibility wrapper. New code should use Config.instance().load_app_settings()"""
-    return Config.instance().load_app_settings()
+    return cfg.load_app_settings()
 
 def save_app_settings(settings: dict):
     """Backward compatibility wrapper. New code should use Config.instance().save_app_settings()"""
-    Config.instance().save_app_settings(settings)
+    cfg.save_app_settings(settings)
 
 def add_to_project_history(project_name: str, project_path: str = None):
     """Backward compatibility wrapper. New code should use Config.instance().add_to_project_history()"""
-    Config.instance().add_to_project_history(project_name, project_path)
+    cfg.add_to_project_history(project_name, project_path)
 
 def get_project_history() -> list:
     """Backward compatibility wrapper. New code should use Config.instance().get_project_history()
     Returns list of dicts with 'name' and 'path' keys.
     """
-    return Config.instance().get_project_history()
+    return cfg.get_project_history()
 
 def get_project_history_names() -> list:
     """Backward compatibility wrapper. New code should use Config.instance().get_project_history_names()
     Returns list of project name strings only.
     """
-    return Config.instance().get_project_history_names()
+    return cfg.get_project_history_names()
 
 def get_project_config_path(output_folder: str) -> Path:
     """Backward compatibility wrapper. New code should use Config.instance()._get_project_config_path()"""
-    return Config.instance()._get_project_config_path(output_folder)
+    return cfg._get_project_config_path(output_folder)
 
 def load_config(output_folder: str = None) -> dict:
     """Backward compatibility wrapper. New code should use Config.instance().load()"""
-    return Config.instance().load(output_folder)
+    return cfg.load(output_folder)
 
 def save_config(config: dict, output_folder: str):
     """Backward compatibility wrapper. New code should use Config.instance().save()"""
-    Config.instance().set(config)
-    Config.instance().save(output_folder)
+    cfg.set(config)
+    cfg.save(output_folder)
 
-
-# ============================================================================
-# Module-level convenience: Shorthand for Config.instance()
-# ============================================================================
-# Usage: from slideshow.config import cfg
-#        params = cfg.get_ffmpeg_encoding_params()
-cfg = Config.instance()
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
 
+from slideshow.gui.helpers import dialog_initial_dir
+
 
 class AppSettingsDialog:
     """Dialog for viewing and editing global app settings (~/SlideShowBuilder/slideshow_settings.json)"""
@@ -121,14 +123,14 @@ class AppSettingsDialog:
 
     def _browse_dir(self, var):
         from tkinter import filedialog
-        d = filedialog.askdirectory(initialdir=var.get() or str(Path.home()))
+        d = filedialog.askdirectory(initialdir=dialog_initial_dir(var.get()))
         if d:
             var.set(d)
 
     def _browse_file(self, var, title, filetypes):
         from tkinter import filedialog
         current = var.get()
-        initial = str(Path(current).parent) if current and Path(current).parent.is_dir() else str(Path.home())
+        initial = dialog_initial_dir(str(Path(current).parent) if current else "")
         f = filedialog.askopenfilename(title=title, filetypes=filetypes, initialdir=initial)
         if f:
             var.set(f)
@@ -162,7 +164,9 @@ class AppSettingsDialog:
 
         # Reset ffmpeg path cache so new paths take effect
         from slideshow.transitions.ffmpeg_paths import FFmpegPaths
+        from slideshow.transitions import reset_available_transitions
         FFmpegPaths().reset()
+        reset_available_transitions()
 
         self.parent.log_message("App settings saved")
         self.dialog.destroy()
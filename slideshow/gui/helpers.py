@@ -1,7 +1,12 @@
 import re
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 from pathlib import Path
+from slideshow.config import Config
+
+# Whitespace and hyphens are dropped from project names to form folder names
+_SANITIZE_RE = re.compile(r'[\s\-]+')
 
 
 def wide_messagebox(msg_type, title, message):
@@ -77,7 +82,7 @@ def wide_messagebox(msg_type, title, message):
 
 def sanitize_project_name(name: str) -> str:
     """Remove spaces and special characters from project name for folder."""
-    return re.sub(r'[\s\-]+', '', name)
+    return _SANITIZE_RE.sub('', name)
 
 def build_project_paths(project_name: str) -> tuple[str, str]:
     """
@@ -86,12 +91,15 @@ def build_project_paths(project_name: str) -> tuple[str, str]:
     """
     if not project_name:
         return ("", "")
-    sanitized = sanitize_project_name(project_name)
-    from slideshow.config import Config
-    base_path = Config.APP_SETTINGS_DIR / sanitized
-    input_path = str(base_path / "Slides")
-    output_path = str(base_path / "Output")
-    return (input_path, output_path)
+    # The base folder is passed in (not read inside the cached function) since
+    # the user can move it at runtime
+    return _project_paths(Config.APP_SETTINGS_DIR, sanitize_project_name(project_name))
+
+@lru_cache(maxsize=128)
+def _project_paths(base_dir: Path, folder_name: str) -> tuple[str, str]:
+    """(input_path, output_path) for a project folder under base_dir"""
+    base_path = base_dir / folder_name
+    return (str(base_path / "Slides"), str(base_path / "Output"))
 
 def build_output_path(base_folder: str, project_name: str) -> str:
     """Build full output path: base_folder/projectname (no spaces)."""
@@ -99,3 +107,22 @@ def build_output_path(base_folder: str, project_name: str) -> str:
         return base_folder
     sanitized = sanitize_project_name(project_name)
     return str(Path(base_folder) / sanitized)
+
+def dialog_initial_dir(*candidates) -> str:
+    """Pick the initialdir for a file/folder dialog.
+    
+    Returns the first candidate that exists as a directory, walking up from
+    paths that no longer exist (e.g. a moved project) to their nearest
+    existing parent. Falls back to the home folder so the dialog never opens
+    on the working directory.
+    """
+    for candidate in candidates:
+        if not candidate:
+            continue
+        path = Path(candidate).expanduser()
+        if not path.is_absolute():
+            continue
+        for folder in (path, *path.parents):
+            if folder.is_dir():
+                return str(folder)
+    return str(Path.home())
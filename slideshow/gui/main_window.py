@@ -1,4 +1,10 @@
+import datetime
+import os
+import subprocess
 import time
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, font
 import threading
@@ -7,20 +13,47 @@ import re
 import shutil
 from pathlib import Path
 from PIL import Image, ImageTk, ImageOps
-from slideshow.config import load_config, save_config, save_app_settings, load_app_settings, get_project_config_path, add_to_project_history, get_project_history
+from slideshow.config import load_config, save_config, save_app_settings, load_app_settings, get_project_config_path, add_to_project_history, get_project_history, flush_config_writes
+from slideshow.transitions import list_available_transitions
 from slideshow.transitions.ffmpeg_cache import FFmpegCache
 
-from slideshow.gui.helpers import wide_messagebox, sanitize_project_name, build_project_paths, build_output_path
+from slideshow.gui.helpers import wide_messagebox, sanitize_project_name, build_project_paths, build_output_path, dialog_initial_dir
 from slideshow.gui.image_rotator import ImageRotatorDialog
 from slideshow.gui.settings_dialog import SettingsDialog
 from slideshow.gui.app_settings_dialog import AppSettingsDialog
 
 
 class GUI(tk.Tk):
+    LOG_FLUSH_MS = 50  # Buffered log entries are written to the panel at most this often
+    MAX_LOG_LINES = 5000  # Oldest log lines are dropped beyond this (Text inserts slow down as it grows)
+    AUTOSAVE_DELAY_MS = 300  # Control edits are saved this long after the last change
+    PROGRESS_POLL_MS = 50  # The latest worker progress is shown at most this often
+    SLIDE_ORDER_KEYS = frozenset({"input_folder", "sort_by_filename", "recurse_folders"})  # Edits invalidate cached slides
+    # Numeric entry fields: config key -> (parser, label for messages, fallback value)
+    NUMERIC_FIELDS = {
+        "photo_duration": (float, "photo duration", 3.0),
+        "video_duration": (float, "video duration", 5.0),
+        "transition_duration": (float, "transition duration", 1.0),
+        "multislide_frequency": (int, "multislide frequency", 10),
+    }
+    
     def __init__(self, version="1.0.0"):
         super().__init__()
         self.title(f"Slideshow Builder v{version}")
         
+        # Log entries waiting for the next _flush_log (appended from any thread)
+        self._log_buf = deque()
+        self._log_mirror = deque(maxlen=self.MAX_LOG_LINES)  # Copy of the panel's text, one item per text line
+        self._log_editable_depth = 0  # Nesting level of _log_editable()
+        self._last_status = None  # Text of the status line update_status last wrote
+        self.log_context_menu = None  # Built on first right-click by _build_log_context_menu
+        self._autosave_after_id = None  # Pending debounced _auto_save_config
+        self._updating_ui = False  # True while loaded config is pushed into the controls (no saves)
+        self._play_state_cache = (None, False)  # ((output_folder, project_name), output exists)
+        # Latest (current, total) from a worker thread, picked up by _drain_progress_slot
+        self._progress_lock = threading.Lock()
+        self._progress_slot = None
+        
         # Load custom slideshows base directory if configured
         self._load_custom_slideshows_dir()
         
@@ -36,6 +69,11 @@ class GUI(tk.Tk):
         
         # Load config - will try to load from last project
         self.config_data = load_config()
+        # Last valid value of each numeric entry, kept current by _on_var_changed
+        self._numeric_cache = {
+            key: self.config_data.get(key, fallback)
+            for key, (_, _, fallback) in self.NUMERIC_FIELDS.items()
+        }
         self.cancel_requested = False  # Flag for cancellation
         self.cached_slides = None  # Cache slides from export to reuse in preview
         self.create_widgets()
@@ -43,10 +81,22 @@ class GUI(tk.Tk):
         
         # Check initial Play button state
         self._check_play_button_state()
+        
+        # Start writing buffered log entries to the log panel
+        self.after(self.LOG_FLUSH_MS, self._drain_log_buffer)
+        self.after(self.PROGRESS_POLL_MS, self._drain_progress_slot)
+        
+        # Save any pending control edits before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _on_close(self):
+        """Flush a pending auto-save, then close the window"""
+        self._flush_autosave()
+        self.destroy()
     
     def _load_custom_slideshows_dir(self):
         """Load custom slideshows base directory from app settings"""
-        from slideshow.config import Config
+        from slideshow.config import Config, ConfigStore
         import json
         
         # First check the default location for settings file
@@ -55,14 +105,15 @@ class GUI(tk.Tk):
         
         custom_dir = str(default_settings_dir)  # Start with default
         
-        # Try to load settings from default location
-        if default_settings_file.exists():
-            try:
-                with open(default_settings_file, "r") as f:
-                    settings = json.load(f)
-                    custom_dir = settings.get("slideshows_base_dir", str(default_settings_dir))
-            except (json.JSONDecodeError, OSError):
-                pass  # Use default if loading fails
+        # Try to load settings from default location. Going through ConfigStore
+        # leaves the parse cached, so the app settings load that follows
+        # (load_config -> AppSettings) doesn't read the same file again.
+        try:
+            settings = ConfigStore.load(default_settings_file)
+            if isinstance(settings, dict):
+                custom_dir = settings.get("slideshows_base_dir", str(default_settings_dir))
+        except (json.JSONDecodeError, OSError):
+            pass  # Missing or unreadable - use default
         
         # Update the Config class constants with the configured directory
         # Use expanduser() to handle ~ in paths
@@ -103,12 +154,13 @@ class GUI(tk.Tk):
         
         # Use combobox for project name with history - display names only
         project_names = [entry["name"] for entry in self.project_history]
+        self._history_names = project_names  # Names currently in the dropdown
         self.name_combo = ttk.Combobox(self, textvariable=self.name_var, width=38, values=project_names)
         self.name_combo.grid(row=0, column=1, columnspan=2, sticky="we")
-        self.name_combo.bind('<FocusIn>', lambda e: self._on_project_name_focus_in())
-        self.name_combo.bind('<FocusOut>', lambda e: self._on_project_name_focus_out())
-        self.name_combo.bind('<Return>', lambda e: self._on_project_name_focus_out())
-        self.name_combo.bind('<<ComboboxSelected>>', lambda e: self._on_project_selected())
+        self.name_combo.bind('<FocusIn>', self._on_project_name_focus_in)
+        self.name_combo.bind('<FocusOut>', self._on_project_name_focus_out)
+        self.name_combo.bind('<Return>', self._on_project_name_focus_out)
+        self.name_combo.bind('<<ComboboxSelected>>', self._on_project_selected)
         
         # Store the project name when focus is gained
         self._project_name_on_focus = ""
@@ -122,44 +174,30 @@ class GUI(tk.Tk):
         ttk.Button(self, text="Browse", command=self.select_slideshows_folder).grid(row=1, column=2)
 
         # Input Folder (now row 2)
-        ttk.Label(self, text="Input Folder:").grid(row=2, column=0, sticky="e")
-        self.input_var = tk.StringVar(value=self.config_data.get("input_folder", ""))
-        self.input_var.trace_add('write', lambda *args: self._invalidate_slide_cache())
-        self.input_var.trace_add('write', lambda *args: self._auto_save_config())
-        ttk.Entry(self, textvariable=self.input_var, width=40).grid(row=2, column=1, sticky="we")
-        ttk.Button(self, text="Browse", command=self.select_input_folder).grid(row=2, column=2)
+        self.input_var, _ = self._add_field_row(2, "Input Folder:", "input_folder", "", browse=self.select_input_folder)
 
-        # Output Folder
-        ttk.Label(self, text="Output Folder:").grid(row=3, column=0, sticky="e")
-        self.output_var = tk.StringVar(value=self.config_data.get("output_folder", ""))
-        output_entry = ttk.Entry(self, textvariable=self.output_var, width=40)
-        output_entry.grid(row=3, column=1, sticky="we")
-        output_entry.bind('<FocusOut>', lambda e: self._auto_save_config())
-        output_entry.bind('<Return>', lambda e: self._auto_save_config())
-        ttk.Button(self, text="Browse", command=self.select_output_folder).grid(row=3, column=2)
+        # Output Folder (saved on focus-out/Return rather than per keystroke)
+        self.output_var, output_entry = self._add_field_row(3, "Output Folder:", "output_folder", "",
+                                                            browse=self.select_output_folder, trace=False)
+        output_entry.bind('<FocusOut>', self._auto_save_config)
+        output_entry.bind('<Return>', self._auto_save_config)
 
         # Soundtrack
-        ttk.Label(self, text="Soundtrack File:").grid(row=4, column=0, sticky="e")
-        self.soundtrack_var = tk.StringVar(value=self.config_data.get("soundtrack", ""))
-        self.soundtrack_var.trace_add('write', lambda *args: self._auto_save_config())
-        ttk.Entry(self, textvariable=self.soundtrack_var, width=40).grid(row=4, column=1, sticky="we")
-        ttk.Button(self, text="Browse", command=self.select_soundtrack).grid(row=4, column=2)
+        self.soundtrack_var, _ = self._add_field_row(4, "Soundtrack File:", "soundtrack", "", browse=self.select_soundtrack)
 
         # Durations
-        ttk.Label(self, text="Photo Duration (s):").grid(row=5, column=0, sticky="e")
-        self.photo_dur_var = tk.IntVar(value=self.config_data.get("photo_duration", 3))
-        self.photo_dur_var.trace_add('write', lambda *args: self._auto_save_config())
-        ttk.Entry(self, textvariable=self.photo_dur_var, width=5).grid(row=5, column=1, sticky="w", padx=(5, 0))
+        self.photo_dur_var, _ = self._add_field_row(5, "Photo Duration (s):", "photo_duration", 3)
 
         # Transition Type (positioned right after Photo Duration in same column area)
         ttk.Label(self, text="Transition:").grid(row=5, column=1, sticky="w", padx=(80, 5))
         self.transition_var = tk.StringVar(value=self.config_data.get("transition_type", "fade"))
-        self.transition_var.trace_add('write', lambda *args: self._auto_save_config())
-        # Log the change for manual verification
-        self.transition_var.trace_add('write', lambda *args: self.log_message(f"Transition type changed to: {self.transition_var.get()}"))
+        self.transition_var.trace_add('write', partial(self._on_var_changed, "transition_type"))
         self.transition_combo = ttk.Combobox(self, textvariable=self.transition_var, width=12, state="readonly")
         self.transition_combo.grid(row=5, column=1, sticky="w", padx=(150, 0))
-        self._populate_transitions()
+        self.transition_combo.bind('<<ComboboxSelected>>', self._on_transition_selected)
+        # Checking which transitions are available can be slow the first time, so
+        # fill the list once the window is up (it shows the saved choice until then)
+        self.after_idle(self._populate_transitions)
         
         # Checkboxes frame (to the right of transition)
         options_frame = ttk.Frame(self)
@@ -167,40 +205,32 @@ class GUI(tk.Tk):
         
         # Sort by filename checkbox (leftmost)
         self.sort_by_filename_var = tk.BooleanVar(value=self.config_data.get("sort_by_filename", False))
-        self.sort_by_filename_var.trace_add('write', lambda *args: self._invalidate_slide_cache())
-        self.sort_by_filename_var.trace_add('write', lambda *args: self._auto_save_config())
+        self.sort_by_filename_var.trace_add('write', partial(self._on_var_changed, "sort_by_filename"))
         sort_by_filename_check = ttk.Checkbutton(options_frame, text="Sort by Filename", 
                                                    variable=self.sort_by_filename_var)
         sort_by_filename_check.grid(row=0, column=0, sticky="w", padx=(0, 10))
         
         # Recurse checkbox (rightmost)
         self.recurse_var = tk.BooleanVar(value=self.config_data.get("recurse_folders", False))
-        self.recurse_var.trace_add('write', lambda *args: self._invalidate_slide_cache())
-        self.recurse_var.trace_add('write', lambda *args: self._auto_save_config())
+        self.recurse_var.trace_add('write', partial(self._on_var_changed, "recurse_folders"))
         recurse_check = ttk.Checkbutton(options_frame, text="Recurse", variable=self.recurse_var)
         recurse_check.grid(row=0, column=1, sticky="w")
 
-        ttk.Label(self, text="Video Duration (s):").grid(row=6, column=0, sticky="e")
-        self.video_dur_var = tk.IntVar(value=self.config_data.get("video_duration", 10))
-        self.video_dur_var.trace_add('write', lambda *args: self._auto_save_config())
-        ttk.Entry(self, textvariable=self.video_dur_var, width=5).grid(row=6, column=1, sticky="w", padx=(5, 0))
+        self.video_dur_var, _ = self._add_field_row(6, "Video Duration (s):", "video_duration", 10)
 
         # MultiSlide Frequency (positioned right after Video Duration in same column area)
         ttk.Label(self, text="MultiSlide Freq:").grid(row=6, column=1, sticky="w", padx=(80, 5))
-        self.multislide_freq_var = tk.IntVar(value=self.config_data.get("multislide_frequency", 10))
-        self.multislide_freq_var.trace_add('write', lambda *args: self._auto_save_config())
+        self.multislide_freq_var = tk.StringVar(value=str(self.config_data.get("multislide_frequency", 10)))
+        self.multislide_freq_var.trace_add('write', partial(self._on_var_changed, "multislide_frequency"))
         ttk.Entry(self, textvariable=self.multislide_freq_var, width=5).grid(row=6, column=1, sticky="w", padx=(200, 0))
         ttk.Label(self, text="(0=off)", font=("TkDefaultFont", 8)).grid(row=6, column=1, sticky="w", padx=(270, 0))
 
-        ttk.Label(self, text="Transition Duration (s):").grid(row=7, column=0, sticky="e")
-        self.trans_dur_var = tk.IntVar(value=self.config_data.get("transition_duration", 1))
-        self.trans_dur_var.trace_add('write', lambda *args: self._auto_save_config())
-        ttk.Entry(self, textvariable=self.trans_dur_var, width=5).grid(row=7, column=1, sticky="w", padx=(5, 0))
+        self.trans_dur_var, _ = self._add_field_row(7, "Transition Duration (s):", "transition_duration", 1)
 
         # Video Quality (positioned right after Transition Duration in same column area as MultiSlide Freq)
         ttk.Label(self, text="Video Quality:").grid(row=7, column=1, sticky="w", padx=(80, 5))
         self.video_quality_var = tk.StringVar(value=self.config_data.get("video_quality", "maximum"))
-        self.video_quality_var.trace_add('write', lambda *args: self._on_video_quality_change())
+        self.video_quality_var.trace_add('write', self._on_video_quality_change)
         quality_combo = ttk.Combobox(self, textvariable=self.video_quality_var, width=10, state="readonly")
         quality_combo['values'] = ('maximum', 'high', 'medium', 'fast')
         quality_combo.grid(row=7, column=1, sticky="w", padx=(190, 0))
@@ -223,7 +253,10 @@ class GUI(tk.Tk):
 
         # Progress Bar
         ttk.Label(self, text="Progress:").grid(row=9, column=0, sticky="nw", pady=(10, 0))
-        self.progress = ttk.Progressbar(self, mode='determinate')
+        # Bound to a variable so a progress update is a single Tcl set
+        self._progress_var = tk.DoubleVar(value=0)
+        self._progress_max = 100  # Last maximum sent to the widget
+        self.progress = ttk.Progressbar(self, mode='determinate', variable=self._progress_var, maximum=self._progress_max)
         self.progress.grid(row=9, column=1, columnspan=3, sticky="ew", padx=(5, 0), pady=(10, 0))
 
         # Log Panel
@@ -237,8 +270,11 @@ class GUI(tk.Tk):
         log_frame.grid_rowconfigure(0, weight=1)
         log_frame.grid_columnconfigure(0, weight=1)
         
-        # Text widget for log
-        self.log_text = tk.Text(log_frame, height=8, width=80, wrap=tk.WORD, state=tk.DISABLED)
+        # Text widget for log: no wrapping (long lines use the horizontal scrollbar,
+        # and inserts don't reflow the panel) and no undo history for appended lines.
+        # The \r overwrite in _flush_log works on text lines, so it is unaffected.
+        self.log_text = tk.Text(log_frame, height=8, width=80, wrap=tk.NONE, state=tk.DISABLED,
+                                undo=False, autoseparators=False, maxundo=0)
         self.log_text.grid(row=0, column=0, sticky="ewns")
         
         # Add clipboard support for log panel
@@ -258,62 +294,157 @@ class GUI(tk.Tk):
         self.grid_rowconfigure(11, weight=1)  # Log panel row expands
         self.grid_columnconfigure(1, weight=1)  # Middle column expands for entry fields
         
-        # Add initial log message
-        self.log_message("Slideshow Builder initialized")
-        
-        # Log available transitions now that log panel is ready
-        self._log_available_transitions()
-        
         # Update project path display now that all variables are initialized
         self._update_project_path_display()
+        
+        # Startup log messages wait until the window has been drawn
+        self.after_idle(self._post_init_logging)
+    
+    def _add_field_row(self, row, label, key, default, browse=None, trace=True):
+        """Create a labelled entry for config key on the given grid row; returns (var, entry)
+        
+        Rows with a browse command get a full-width path entry and a Browse
+        button; the others get a short numeric entry. With trace=True, edits go
+        to the shared _on_var_changed callback.
+        """
+        ttk.Label(self, text=label).grid(row=row, column=0, sticky="e")
+        var = tk.StringVar(value=self.config_data.get(key, default))
+        if trace:
+            var.trace_add('write', partial(self._on_var_changed, key))
+        if browse is not None:
+            entry = ttk.Entry(self, textvariable=var, width=40)
+            entry.grid(row=row, column=1, sticky="we")
+            ttk.Button(self, text="Browse", command=browse).grid(row=row, column=2)
+        else:
+            entry = ttk.Entry(self, textvariable=var, width=5)
+            entry.grid(row=row, column=1, sticky="w", padx=(5, 0))
+        return var, entry
+    
+    def _post_init_logging(self):
+        """Write the startup messages to the log panel once the window is up"""
+        self.log_message("Slideshow Builder initialized")
+        self._log_available_transitions()
 
     def log_message(self, message):
-        """Add a message to the log panel with timestamp or overwrite last line if message ends with \r"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        """Add a message to the log panel with timestamp or overwrite last line if message ends with \r
         
-        self.log_text.configure(state=tk.NORMAL)
-
+        Safe to call from worker threads: the entry is formatted on the calling
+        thread and only appended to a buffer, which the Tk thread drains every
+        LOG_FLUSH_MS (see _drain_log_buffer) - no Tk calls happen here.
+        """
         if message.endswith("\r"):
-            # Overwrite the last line instead of adding a new one
-            message = message.rstrip("\r")
-            self.log_text.delete("end-2l", "end-1l")
-            log_entry = f"[{timestamp}] {message}\n"
-            self.log_text.insert(tk.END, log_entry)
-        else:
-            # Normal log: write entry and leave an extra blank line ready for overwrite logs
-            log_entry = f"[{timestamp}] {message}\n"
-            self.log_text.insert(tk.END, log_entry)
-
-        self.log_text.configure(state=tk.DISABLED)
-        self.log_text.see(tk.END)
+            # Slideshow's log callback marks progress lines this way
+            self.update_status(message.rstrip("\r"))
+            return
+        self._last_status = None
+        timestamp = time.strftime("%H:%M:%S")  # Cheaper than building a datetime per line
+        self._log_buf.append((f"[{timestamp}] {message}\n", False))
+    
+    def update_status(self, message):
+        """Show a progress message in place of the previous one (thread-safe like log_message)
+        
+        The first status after a regular log line gets a line of its own;
+        consecutive status messages then overwrite that line. A repeat of the
+        current status is dropped.
+        """
+        if message == self._last_status:
+            return
+        overwrite = self._last_status is not None  # log_message resets it to None
+        self._last_status = message
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_buf.append((f"[{timestamp}] {message}\n", overwrite))
+    
+    def _drain_log_buffer(self):
+        """Recurring Tk-thread timer: flush buffered log entries every LOG_FLUSH_MS"""
+        self._flush_log()
+        self.after(self.LOG_FLUSH_MS, self._drain_log_buffer)
+    
+    def _flush_log(self):
+        """Write all buffered log entries to the log panel with a single insert"""
+        if not self._log_buf:
+            return
+        
+        lines = []
+        delete_last_line = False
+        while self._log_buf:
+            log_entry, overwrite = self._log_buf.popleft()
+            if overwrite:
+                # Overwrite the last line instead of adding a new one
+                if lines:
+                    lines.pop()
+                else:
+                    delete_last_line = True
+            lines.append(log_entry)
+        
+        text = "".join(lines)
+        # Entries can span several text lines (e.g. tracebacks), so the mirror
+        # and the cap work on text lines, the same unit the widget indexes by.
+        # Split on "\n" only: unlike str.splitlines(), the Text widget doesn't
+        # break lines on "\r" and friends (entries always end in "\n")
+        text_lines = [line + "\n" for line in text.split("\n")[:-1]]
+        
+        # Follow new output only if the user hasn't scrolled up to read history
+        follow = self.log_text.yview()[1] >= 0.999
+        with self._log_editable():
+            if delete_last_line and self._log_mirror:
+                # One replace instead of delete + insert (one Tk call, one reflow);
+                # like the widget, the mirror loses only the last text line
+                self.log_text.replace("end-2l", "end-1l", text)
+                self._log_mirror.pop()
+            else:
+                self.log_text.insert(tk.END, text)
+            
+            # Drop the oldest lines once over the cap (the mirror's maxlen does the same);
+            # count "\n" like the widget's line indices do
+            excess = len(self._log_mirror) + text.count("\n") - self.MAX_LOG_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_mirror.extend(text_lines)
+        if follow:
+            self.log_text.see(tk.END)
+    
+    @contextmanager
+    def _log_editable(self):
+        """Make the read-only log panel writable for the enclosed edits.
+        
+        Only the outermost block toggles the widget state, so nested blocks
+        cost no extra Tk calls.
+        """
+        if self._log_editable_depth == 0:
+            self.log_text.configure(state=tk.NORMAL)
+        self._log_editable_depth += 1
+        try:
+            yield
+        finally:
+            self._log_editable_depth -= 1
+            if self._log_editable_depth == 0:
+                self.log_text.configure(state=tk.DISABLED)
 
 
     def _setup_log_clipboard_support(self):
         """Setup clipboard support for the log panel"""
-        # Create context menu for log panel
+        # Bind right-click to show context menu (the menu itself is created on first use)
+        self.log_text.bind("<Button-3>", self._show_log_context_menu)  # Right-click on macOS/Linux
+        self.log_text.bind("<Control-Button-1>", self._show_log_context_menu)  # Ctrl+click on macOS
+        
+        # Bind keyboard shortcuts
+        self.log_text.bind("<Command-c>", self._copy_selected_log)  # macOS
+        self.log_text.bind("<Control-c>", self._copy_selected_log)  # Windows/Linux
+        self.log_text.bind("<Command-a>", self._select_all_log)  # macOS
+        self.log_text.bind("<Control-a>", self._select_all_log)  # Windows/Linux
+
+    def _build_log_context_menu(self):
+        """Create the log panel's context menu"""
         self.log_context_menu = tk.Menu(self, tearoff=0)
         self.log_context_menu.add_command(label="Copy All", command=self._copy_all_log)
         self.log_context_menu.add_command(label="Copy Selected", command=self._copy_selected_log)
         self.log_context_menu.add_separator()
         self.log_context_menu.add_command(label="Clear Log", command=self._clear_log)
-        
-        # Bind right-click to show context menu
-        self.log_text.bind("<Button-3>", self._show_log_context_menu)  # Right-click on macOS/Linux
-        self.log_text.bind("<Control-Button-1>", self._show_log_context_menu)  # Ctrl+click on macOS
-        
-        # Bind keyboard shortcuts
-        self.log_text.bind("<Command-c>", lambda e: self._copy_selected_log())  # macOS
-        self.log_text.bind("<Control-c>", lambda e: self._copy_selected_log())  # Windows/Linux
-        self.log_text.bind("<Command-a>", lambda e: self._select_all_log())  # macOS
-        self.log_text.bind("<Control-a>", lambda e: self._select_all_log())  # Windows/Linux
-        
-        # Enable text selection
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.configure(state=tk.DISABLED)
 
     def _show_log_context_menu(self, event):
         """Show context menu for log panel"""
+        if self.log_context_menu is None:
+            self._build_log_context_menu()
         try:
             # Check if there's selected text
             if self.log_text.tag_ranges(tk.SEL):
@@ -328,72 +459,69 @@ class GUI(tk.Tk):
     def _copy_all_log(self):
         """Copy all log content to clipboard"""
         try:
-            self.log_text.configure(state=tk.NORMAL)
-            content = self.log_text.get(1.0, tk.END)
+            self._flush_log()
+            # Join the Python-side copy rather than pulling the whole widget text through Tcl
+            content = "".join(self._log_mirror)
             self.clipboard_clear()
             self.clipboard_append(content.strip())
-            self.log_text.configure(state=tk.DISABLED)
             self.log_message("All log content copied to clipboard")
         except Exception as e:
             self.log_message(f"Failed to copy log content: {e}")
 
-    def _copy_selected_log(self):
+    def _copy_selected_log(self, event=None):
         """Copy selected log content to clipboard"""
         try:
+            # Reading works on a DISABLED Text widget, so the state is left alone
             if self.log_text.tag_ranges(tk.SEL):
-                self.log_text.configure(state=tk.NORMAL)
                 selected_text = self.log_text.selection_get()
                 self.clipboard_clear()
                 self.clipboard_append(selected_text)
-                self.log_text.configure(state=tk.DISABLED)
                 self.log_message("Selected log content copied to clipboard")
             else:
                 # If no selection, copy current line
-                self.log_text.configure(state=tk.NORMAL)
                 current_line = self.log_text.get("insert linestart", "insert lineend")
                 if current_line.strip():
                     self.clipboard_clear()
                     self.clipboard_append(current_line.strip())
                     self.log_message("Current line copied to clipboard")
-                self.log_text.configure(state=tk.DISABLED)
         except tk.TclError:
             # No selection
             self.log_message("No text selected to copy")
         except Exception as e:
             self.log_message(f"Failed to copy selected text: {e}")
 
-    def _select_all_log(self):
-        """Select all text in log panel"""
-        self.log_text.configure(state=tk.NORMAL)
+    def _select_all_log(self, event=None):
+        """Select all text in log panel (tags and marks work while the widget is DISABLED)"""
         self.log_text.tag_add(tk.SEL, "1.0", tk.END)
         self.log_text.mark_set(tk.INSERT, "1.0")
         self.log_text.see(tk.INSERT)
-        self.log_text.configure(state=tk.DISABLED)
 
     def _clear_log(self):
         """Clear all log content"""
         result = messagebox.askyesno("Clear Log", "Are you sure you want to clear all log content?")
         if result:
-            self.log_text.configure(state=tk.NORMAL)
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.configure(state=tk.DISABLED)
+            self._log_buf.clear()
+            with self._log_editable():
+                self.log_text.delete(1.0, tk.END)
+            self._log_mirror.clear()
             self.log_message("Log cleared")
 
     def update_progress(self, value, maximum=100):
-        """Update progress bar with current value"""
-        self.progress['maximum'] = maximum
-        self.progress['value'] = value
-        self.update_idletasks()  # Force GUI update
+        """Update progress bar with current value (Tk repaints it on the next idle cycle)"""
+        if maximum != self._progress_max:
+            self.progress['maximum'] = maximum
+            self._progress_max = maximum
+        self._progress_var.set(value)
 
     def reset_progress(self):
         """Reset progress bar to 0"""
-        self.progress['value'] = 0
-        self.update_idletasks()
+        with self._progress_lock:
+            self._progress_slot = None  # Drop any update the worker posted before this
+        self._progress_var.set(0)
 
     def select_input_folder(self):
-        import os
         old_folder = self.input_var.get()
-        initial_dir = old_folder if old_folder else os.path.expanduser('~')
+        initial_dir = dialog_initial_dir(old_folder)
         folder = filedialog.askdirectory(initialdir=initial_dir)
         if folder and folder != old_folder:
             self.input_var.set(folder)
@@ -408,14 +536,9 @@ class GUI(tk.Tk):
                     self.log_message(f"[FFmpegCache] Warning: Failed to clear cache: {e}")
 
     def select_output_folder(self):
-        import os
         current_folder = self.output_var.get()
         # Strip project name folder if it exists to get base folder
-        if current_folder:
-            parent = str(Path(current_folder).parent)
-            initial_dir = parent if parent != '.' else os.path.expanduser('~')
-        else:
-            initial_dir = os.path.expanduser('~')
+        initial_dir = dialog_initial_dir(str(Path(current_folder).parent) if current_folder else "")
         
         folder = filedialog.askdirectory(initialdir=initial_dir)
         if folder:
@@ -437,11 +560,10 @@ class GUI(tk.Tk):
     def select_slideshows_folder(self):
         """Browse for a new base Slideshows folder location"""
         from slideshow.config import Config
-        import os
         
         # Get current slideshows directory
         current_dir = str(Config.APP_SETTINGS_DIR)
-        initial_dir = current_dir if os.path.exists(current_dir) else os.path.expanduser('~')
+        initial_dir = dialog_initial_dir(current_dir)
         
         folder = filedialog.askdirectory(
             initialdir=initial_dir,
@@ -475,14 +597,14 @@ class GUI(tk.Tk):
                 self.output_var.set(new_output)
                 self.log_message(f"Updated project paths to new location")
 
-    def _on_project_name_focus_in(self):
+    def _on_project_name_focus_in(self, event=None):
         """Handle focus-in: Store current project name for comparison on focus-out"""
         current_name = self.name_var.get().strip()
         
         # Store what's currently at top of queue for comparison on focus-out
         self._project_name_on_focus = current_name
     
-    def _on_project_name_focus_out(self):
+    def _on_project_name_focus_out(self, event=None):
         """Handle focus-out: Compare with stored name, only update if different"""
         new_name = self.name_var.get().strip()
         
@@ -511,7 +633,7 @@ class GUI(tk.Tk):
             # No project name, just show base directory
             self.project_path_var.set(str(Config.APP_SETTINGS_DIR))
     
-    def _on_project_selected(self):
+    def _on_project_selected(self, event=None):
         """Handle selection from project history dropdown"""
         selected_name = self.name_var.get().strip()
         if not selected_name:
@@ -604,9 +726,12 @@ class GUI(tk.Tk):
     def _refresh_project_history(self):
         """Refresh the project history dropdown"""
         self.project_history = get_project_history()  # Returns list of dicts with name and path
-        # Update combobox with just the names
+        # Update combobox with just the names (only when they changed - setting
+        # values rebuilds the dropdown list)
         project_names = [entry["name"] for entry in self.project_history]
-        self.name_combo['values'] = project_names
+        if project_names != self._history_names:
+            self._history_names = project_names
+            self.name_combo['values'] = project_names
     
     def _on_project_name_change(self):
         """Handle project name changes on focus loss - update folder paths and load/save config."""
@@ -647,8 +772,8 @@ class GUI(tk.Tk):
                 else:
                     # New project - reset intro_title to defaults before saving
                     self.log_message(f"Creating new project: {new_project_name}")
-                    from slideshow.config import DEFAULT_CONFIG
-                    self.config_data["intro_title"] = dict(DEFAULT_CONFIG["intro_title"])
+                    from slideshow.config import Config
+                    self.config_data["intro_title"] = Config.default_config()["intro_title"]
                     self._auto_save_config()
             else:
                 # No path change, just save
@@ -706,9 +831,9 @@ class GUI(tk.Tk):
             self.log_message(f"Error loading project: {e}")
     
     def select_soundtrack(self):
-        import os
         current_file = self.soundtrack_var.get()
-        initial_dir = os.path.dirname(current_file) if current_file else os.path.expanduser('~')
+        initial_dir = dialog_initial_dir(os.path.dirname(current_file) if current_file else "",
+                                         self.config_data.get("input_folder", ""))
         file = filedialog.askopenfilename(initialdir=initial_dir, filetypes=[("Audio Files", "*.mp3 *.wav")])
         if file:
             self.soundtrack_var.set(file)
@@ -716,8 +841,6 @@ class GUI(tk.Tk):
 
     def _populate_transitions(self):
         """Populate the transition dropdown with available transitions"""
-        from slideshow.transitions import list_available_transitions
-        
         try:
             available_transitions = list_available_transitions()
             transition_names = [t['name'] for t in available_transitions]
@@ -741,8 +864,6 @@ class GUI(tk.Tk):
 
     def _log_available_transitions(self):
         """Log available transitions to the log panel"""
-        from slideshow.transitions import list_available_transitions
-        
         try:
             available_transitions = list_available_transitions()
             if available_transitions:
@@ -764,51 +885,8 @@ class GUI(tk.Tk):
             "resolution": self.config_data.get("resolution", [1920, 1080])
         }
         
-        # Handle numeric fields with validation and error reporting
-        def safe_get_float(var, field_name, default_value):
-            try:
-                # Get raw string value first
-                raw_value = var._tk.globalgetvar(var._name)
-                if raw_value == "" or raw_value is None:
-                    return default_value
-                return float(raw_value)
-            except (ValueError, TypeError, tk.TclError, AttributeError) as e:
-                error_msg = f"Invalid {field_name} - using previous value ({default_value})"
-                self.log_message(error_msg)
-                return default_value
-        
-        def safe_get_int(var, field_name, default_value):
-            try:
-                # Get raw string value first
-                raw_value = var._tk.globalgetvar(var._name)
-                if raw_value == "" or raw_value is None:
-                    return default_value
-                return int(raw_value)
-            except (ValueError, TypeError, tk.TclError, AttributeError) as e:
-                error_msg = f"Invalid {field_name} - using previous value ({default_value})"
-                self.log_message(error_msg)
-                return default_value
-        
-        # Get numeric values with validation
-        config["photo_duration"] = safe_get_float(
-            self.photo_dur_var, "photo duration", 
-            self.config_data.get("photo_duration", 3.0)
-        )
-        
-        config["video_duration"] = safe_get_float(
-            self.video_dur_var, "video duration", 
-            self.config_data.get("video_duration", 5.0)
-        )
-        
-        config["transition_duration"] = safe_get_float(
-            self.trans_dur_var, "transition duration", 
-            self.config_data.get("transition_duration", 1.0)
-        )
-        
-        config["multislide_frequency"] = safe_get_int(
-            self.multislide_freq_var, "multislide frequency",
-            self.config_data.get("multislide_frequency", 10)
-        )
+        # Numeric fields come from the values parsed as they were typed
+        config.update(self._numeric_cache)
         
         config["video_quality"] = self.video_quality_var.get()
         config["recurse_folders"] = self.recurse_var.get()
@@ -816,10 +894,10 @@ class GUI(tk.Tk):
         
         return config
     
-    def _on_video_quality_change(self):
+    def _on_video_quality_change(self, *args):
         """Handle video quality changes - clear cache and save config"""
         # Skip if we're updating UI from loaded config
-        if getattr(self, '_updating_ui', False):
+        if self._updating_ui:
             return
         
         # Get current quality from GUI (new value)
@@ -858,10 +936,60 @@ class GUI(tk.Tk):
         # Now save the config (this will update self.config_data)
         self._auto_save_config()
     
-    def _auto_save_config(self):
+    def _on_var_changed(self, name, *args):
+        """Single trace callback for the main controls; name is the config key the variable edits"""
+        if name in self._numeric_cache:
+            self._update_numeric_cache(name, args[0])
+        elif name in self.SLIDE_ORDER_KEYS:
+            self._invalidate_slide_cache()
+        self._schedule_autosave()
+    
+    def _on_transition_selected(self, event=None):
+        """Log a transition picked in the combobox (programmatic set() calls don't fire this)"""
+        # Log the change for manual verification
+        self.log_message(f"Transition type changed to: {self.transition_var.get()}")
+    
+    def _update_numeric_cache(self, name, tcl_name):
+        """Parse a numeric entry once per edit; invalid text keeps the previous value"""
+        parse, label, _ = self.NUMERIC_FIELDS[name]
+        try:
+            raw_value = self.getvar(tcl_name)
+        except tk.TclError:
+            return
+        if raw_value == "" or raw_value is None:
+            return  # Entry cleared mid-edit - keep the last valid value
+        try:
+            self._numeric_cache[name] = parse(raw_value)
+        except (ValueError, TypeError):
+            self.log_message(f"Invalid {label} - using previous value ({self._numeric_cache[name]})")
+    
+    def _schedule_autosave(self, *args):
+        """Trace callback: save the config once edits pause for AUTOSAVE_DELAY_MS.
+        
+        Typing in an entry fires a trace per keystroke; restarting the timer on
+        each one collapses them into a single save.
+        """
+        # Skip if we're updating UI from loaded config
+        if self._updating_ui:
+            return
+        if self._autosave_after_id is not None:
+            self.after_cancel(self._autosave_after_id)
+        self._autosave_after_id = self.after(self.AUTOSAVE_DELAY_MS, self._auto_save_config)
+    
+    def _flush_autosave(self):
+        """Run a pending debounced auto-save now (before anything reads config_data)"""
+        if self._autosave_after_id is not None:
+            self._auto_save_config()
+    
+    def _auto_save_config(self, event=None):
         """Automatically update and save config when controls change"""
+        # A direct save supersedes any pending debounced one
+        if self._autosave_after_id is not None:
+            self.after_cancel(self._autosave_after_id)
+            self._autosave_after_id = None
+        
         # Skip if we're updating UI from loaded config
-        if getattr(self, '_updating_ui', False):
+        if self._updating_ui:
             return
         
         old_input_folder = self.config_data.get("input_folder", "")
@@ -947,6 +1075,7 @@ class GUI(tk.Tk):
 
     def open_settings(self):
         """Open the comprehensive settings dialog"""
+        self._flush_autosave()
         try:
             SettingsDialog(self)
         except Exception as e:
@@ -968,90 +1097,111 @@ class GUI(tk.Tk):
 
     def play_slideshow(self):
         """Play the exported slideshow video"""
-        import os
-        import subprocess
         
-        # Get the expected output path from current config
-        current_config = self._get_current_config()
-        output_path = Path(current_config["output_folder"]) / f"{current_config['project_name']}.mp4"
+        # Get the expected output path from the current controls
+        output_path = Path(self.output_var.get()) / f"{self.name_var.get()}.mp4"
         
         if output_path.exists():
             self.log_message(f"Opening slideshow: {output_path}")
+            # The launchers are fire-and-forget; Popen only raises when the
+            # launcher itself can't be started, so there's nothing to retry
             try:
                 if sys.platform == 'darwin':  # macOS
-                    # First try to open with QuickTime Player directly
-                    result = subprocess.run([
+                    # First try to open with QuickTime Player directly; the result
+                    # is polled from the Tk loop so the window stays responsive
+                    proc = subprocess.Popen([
                         'open', '-a', 'QuickTime Player', str(output_path)
-                    ], capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        self.log_message("Opening in QuickTime Player...")
-                        # Brief pause then try to autoplay
-                        import time
-                        time.sleep(1.0)  # Give QuickTime time to load
-                        
-                        # Try to autoplay
-                        subprocess.run([
-                            'osascript', '-e',
-                            'tell application "QuickTime Player" to play the front document'
-                        ], capture_output=True)
-                        self.log_message("Slideshow should start playing automatically")
-                    else:
-                        # Fallback to default player
-                        subprocess.run(['open', str(output_path)], capture_output=True)
-                        self.log_message("Opened with default video player")
+                    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    self.after(50, self._poll_quicktime_open, proc, output_path)
                         
                 elif os.name == 'nt':  # Windows
                     os.startfile(str(output_path))
                     self.log_message("Slideshow opened in default player")
                 else:  # Linux
-                    subprocess.run(['xdg-open', str(output_path)], capture_output=True)
+                    subprocess.Popen(['xdg-open', str(output_path)],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     self.log_message("Slideshow opened in default player")
                     
-            except Exception as e:
+            except OSError as e:
                 self.log_message(f"Failed to open slideshow: {e}")
-                # Final fallback
-                try:
-                    if sys.platform == 'darwin':
-                        subprocess.run(['open', str(output_path)], capture_output=True)
-                    elif os.name == 'nt':
-                        os.startfile(str(output_path))
-                    else:
-                        subprocess.run(['xdg-open', str(output_path)], capture_output=True)
-                    self.log_message("Slideshow opened with basic method")
-                except Exception as e2:
-                    self.log_message(f"All methods failed: {e2}")
         else:
             self.log_message(f"Slideshow not found: {output_path}. Please export the slideshow first.")
+            self._check_play_button_state(refresh=True)
     
-    def _on_progress(self, current, total, message=None):
-        """Thread-safe progress update callback"""
-        if message:
-            self.after(0, lambda: self._update_progress_with_message(current, total, message))
+    def _poll_quicktime_open(self, proc, output_path):
+        """Tk timer: wait for 'open -a QuickTime Player' to exit, then autoplay or fall back"""
+        returncode = proc.poll()
+        if returncode is None:
+            self.after(50, self._poll_quicktime_open, proc, output_path)
+        elif returncode == 0:
+            self.log_message("Opening in QuickTime Player...")
+            # Give QuickTime time to load before asking it to play
+            self.after(1000, self._quicktime_autoplay)
         else:
-            self.after(0, lambda: self.update_progress(current, total))
+            # Fallback to default player
+            subprocess.Popen(['open', str(output_path)],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.log_message("Opened with default video player")
+    
+    def _quicktime_autoplay(self):
+        """Ask QuickTime Player to play the document it just opened"""
+        try:
+            subprocess.Popen([
+                'osascript', '-e',
+                'tell application "QuickTime Player" to play the front document'
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.log_message("Slideshow should start playing automatically")
+        except OSError as e:
+            self.log_message(f"Failed to autoplay slideshow: {e}")
     
-    def _update_progress_with_message(self, current, total, message):
-        """Update progress bar and optionally log message"""
-        self.update_progress(current, total)
-        # Log message with carriage return to overwrite previous progress messages
+    def _on_progress(self, current, total, message=None):
+        """Thread-safe progress update callback
+        
+        Only the latest value is kept; _drain_progress_slot shows it every
+        PROGRESS_POLL_MS, however often the worker reports.
+        """
+        with self._progress_lock:
+            self._progress_slot = (current, total)
+        # Progress messages overwrite each other instead of filling the log
         if message:
-            self.log_message(message + "\r")
+            self.update_status(message)
+    
+    def _drain_progress_slot(self):
+        """Recurring Tk-thread timer: show the latest worker progress every PROGRESS_POLL_MS"""
+        with self._progress_lock:
+            slot, self._progress_slot = self._progress_slot, None
+        if slot is not None:
+            self.update_progress(*slot)
+        self.after(self.PROGRESS_POLL_MS, self._drain_progress_slot)
     
     def _on_log_message(self, message):
         """Thread-safe log message callback"""
-        self.after(0, lambda: self.log_message(message))
+        self.log_message(message)
     
-    def _check_play_button_state(self):
-        """Enable/disable Play button based on output file existence"""
-        current_config = self._get_current_config()
-        output_path = Path(current_config["output_folder"]) / f"{current_config['project_name']}.mp4"
-        if output_path.exists():
+    def _check_play_button_state(self, refresh=False):
+        """Enable/disable Play button based on output file existence
+        
+        This runs after every config save, so the check is cached per
+        (output folder, project name): while neither changes, there is no stat()
+        and the button is left as it is. Pass refresh=True when the output file
+        may have been created or removed (e.g. after an export).
+        """
+        key = (self.output_var.get(), self.name_var.get())
+        if not refresh and key == self._play_state_cache[0]:
+            return
+        folder, name = key
+        # Without both parts there is no output file (don't stat "<cwd>/.mp4")
+        exists = bool(folder and name) and os.path.isfile(os.path.join(folder, name + ".mp4"))
+        self._play_state_cache = (key, exists)
+        
+        if exists:
             self.play_button.configure(state='normal')
         else:
             self.play_button.configure(state='disabled')
 
     def export_video(self):
+        self._flush_autosave()
+        
         # Quick validation of input folder before starting export
         input_folder = Path(self.input_var.get().strip())
         
@@ -1085,20 +1235,29 @@ class GUI(tk.Tk):
         # Disable export button during processing
         self.export_button.configure(state='disabled')
         self.play_button.configure(state='disabled')  # Disable play during export
+        self._play_state_cache = (None, False)  # Button no longer matches the cached state
         self.cancel_button.configure(state='normal')  # Enable cancel during export
         
         # Reset cancellation flag
         self.cancel_requested = False
         
+        # Read the controls here: the export thread must not touch Tk variables
+        current_config = self._get_current_config()
+        
         # Run export in background thread (validation moved to thread to avoid blocking UI)
-        export_thread = threading.Thread(target=self._export_video_thread, daemon=True)
+        export_thread = threading.Thread(target=self._export_video_thread, args=(current_config,), daemon=True)
         export_thread.start()
     
-    def _export_video_thread(self):
-        """Background thread for video export"""
+    def _export_video_thread(self, current_config):
+        """Background thread for video export
+        
+        current_config is the snapshot of the controls taken by export_video.
+        Log output goes through the thread-safe log_message; widget changes are
+        handed to the Tk thread with after().
+        """
         output_path = None
         try:
-            self.after(0, lambda: self.log_message("Validating input folder..."))
+            self.log_message("Validating input folder...")
             
             # Validate that input folder has media files (do this in background thread to avoid blocking UI)
             input_folder = Path(self.config_data.get("input_folder", "").strip())
@@ -1128,10 +1287,7 @@ class GUI(tk.Tk):
                               "Please add photos or videos before exporting."))
                 return
             
-            self.after(0, lambda: self.log_message("Loading slides..."))
-            
-            # Ensure config_data is synchronized with current UI state before export
-            current_config = self._get_current_config()
+            self.log_message("Loading slides...")
             
             # Validate and rebuild output folder from project name to ensure consistency
             # Note: Input folder can be anywhere (NAS, external drive, etc.) so we don't validate it
@@ -1144,7 +1300,7 @@ class GUI(tk.Tk):
                 if current_output != correct_output_folder:
                     current_config["output_folder"] = correct_output_folder
                     self.after(0, lambda out=correct_output_folder: self.output_var.set(out))
-                    self.after(0, lambda out=correct_output_folder: self.log_message(f"Output folder updated: {out}"))
+                    self.log_message(f"Output folder updated: {correct_output_folder}")
                 else:
                     # Output folder is already correct, use it
                     correct_output_folder = current_output
@@ -1172,8 +1328,9 @@ class GUI(tk.Tk):
                 if not current_input:
                     current_config["input_folder"] = default_input_folder
                     self.after(0, lambda inp=default_input_folder: self.input_var.set(inp))
-                    self.after(0, lambda inp=default_input_folder: self.log_message(f"Input folder set to default: {inp}"))
+                    self.log_message(f"Input folder set to default: {default_input_folder}")
             
+            # Ensure config_data is synchronized with the UI state before export
             self.config_data.update(current_config)
             
             # Build output path
@@ -1193,34 +1350,37 @@ class GUI(tk.Tk):
             
             # Check if cancelled at the end
             if self.cancel_requested:
-                self.after(0, lambda: self.log_message("[GUI] Export cancelled by user"))
+                self.log_message("[GUI] Export cancelled by user")
                 return
             
             # Success
             if output_path:
-                self.after(0, lambda: self.update_progress(100, 100))
-                # Brief pause to show 100% completion
-                import time
-                time.sleep(0.5)
-                self.after(500, self.reset_progress)  # Reset progress bar after brief pause
-                self.after(0, self._check_play_button_state)  # Enable Play button
+                self.after(0, self._finalize_export_ui)
         except Exception as e:
             # Check if it was a cancellation
             if self.cancel_requested:
                 error_msg = "Export cancelled by user"
             else:
                 error_msg = f"Export failed: {str(e)}"
-            self.after(0, lambda msg=error_msg: self.log_message(msg))
+            self.log_message(error_msg)
             self.after(0, self.reset_progress)  # Reset progress on error too
         finally:
             # Re-enable export button and disable cancel button
             self.after(0, self._re_enable_export_button)
     
+    def _finalize_export_ui(self):
+        """Show 100% after a successful export, enable Play, then reset the bar"""
+        with self._progress_lock:
+            self._progress_slot = None  # A late worker update must not overwrite 100%
+        self.update_progress(100, 100)
+        self._check_play_button_state(refresh=True)  # Enable Play button
+        self.after(500, self.reset_progress)  # Reset progress bar after a brief pause at 100%
+    
     def _re_enable_export_button(self):
         """Re-enable the export button after processing"""
         self.export_button.configure(state='normal')
         self.cancel_button.configure(state='disabled')  # Disable cancel when not exporting
-        # Play button state will be set by _check_play_button_state() call
+        self._check_play_button_state(refresh=True)  # Re-enable Play if the output file exists
 
     def cancel_export(self):
         """Cancel the current export operation"""
@@ -1230,6 +1390,7 @@ class GUI(tk.Tk):
     
     def rename_project(self):
         """Rename the current project folder and update all paths"""
+        self._flush_autosave()
         current_project_name = self.name_var.get().strip()
         if not current_project_name:
             wide_messagebox("error", "Error", "No project is currently loaded.")
@@ -1284,8 +1445,9 @@ class GUI(tk.Tk):
                     # Input folder is external (like NAS)
                     input_is_internal = False
             
-            # Now rename the project folder
+            # Now rename the project folder (land any queued config saves first)
             self.log_message(f"Renaming project folder from {current_project_folder.name} to {sanitized_new}...")
+            flush_config_writes()
             current_project_folder.rename(new_project_folder)
             
             # Update input path based on whether it was internal or external
@@ -1478,6 +1640,8 @@ class GUI(tk.Tk):
     
     def _load_and_cache_slides(self):
         """Load slides using slideshow model and cache them for reuse"""
+        self._flush_autosave()
+        
         # Show a loading dialog with progress bar
         loading_dialog = tk.Toplevel(self)
         loading_dialog.title("Loading Slides")
@@ -1536,9 +1700,33 @@ class GUI(tk.Tk):
         thread = threading.Thread(target=load_thread, daemon=True)
         thread.start()
         
-        # Poll for completion and update progress in a blocking loop
-        while thread.is_alive():
-            # Update GUI with current progress state
+        def finish():
+            """Tk thread: close the loading dialog and use the loaded slides"""
+            try:
+                loading_dialog.destroy()
+            except Exception:
+                pass
+            
+            if result_container['error']:
+                # Handle error
+                error = result_container['error']
+                self.log_message(f"Error loading slides: {error['exception']}")
+                self.log_message(f"Traceback:\n{error['traceback']}")
+                wide_messagebox("error", "Error", f"Failed to load slides:\n{error['exception']}")
+                self.cached_slides = None
+            elif result_container['slideshow']:
+                # Success - cache the slides
+                self.cached_slides = result_container['slideshow'].slides
+                
+                # Now open the preview dialog
+                if self.cached_slides:
+                    ImageRotatorDialog(self, self.cached_slides)
+        
+        def poll():
+            """Tk timer: show the loader's progress every 50ms until the thread finishes"""
+            if not thread.is_alive():
+                finish()
+                return
             try:
                 current = progress_state['current']
                 total = progress_state['total']
@@ -1548,36 +1736,14 @@ class GUI(tk.Tk):
                     percent = int((current / total) * 100)
                     progress_bar['value'] = percent
                     loading_label.config(text=message)
-                
-                # Process pending events
-                loading_dialog.update()
             except Exception:
-                break  # Dialog was destroyed
-            
-            # Wait 50ms before next check
-            time.sleep(0.05)
-        
-        # Thread finished - cleanup
-        try:
-            loading_dialog.destroy()
-        except Exception:
-            pass
+                finish()  # Dialog was destroyed
+                return
+            self.after(50, poll)
         
-        if result_container['error']:
-            # Handle error
-            error = result_container['error']
-            self.log_message(f"Error loading slides: {error['exception']}")
-            self.log_message(f"Traceback:\n{error['traceback']}")
-            wide_messagebox("error", "Error", f"Failed to load slides:\n{error['exception']}")
-            self.cached_slides = None
-        elif result_container['slideshow']:
-            # Success - cache the slides
-            self.cached_slides = result_container['slideshow'].slides
-            
-            # Now open the preview dialog
-            if self.cached_slides:
-                ImageRotatorDialog(self, self.cached_slides)
-
+        # Poll from the event loop instead of a sleep/update() loop, so the
+        # main window keeps handling events while slides load
+        self.after(50, poll)
     
     def _invalidate_slide_cache(self):
         """Invalidate cached slides when input folder or sort settings change"""
@@ -1662,7 +1828,6 @@ class GUI(tk.Tk):
                 self.log_message(f"Sorted {len(image_files)} images alphabetically by filename")
             else:
                 # Sort by date taken (same as slideshow model)
-                import datetime
                 from PIL import Image
                 from PIL.ExifTags import TAGS
                 
@@ -1,16 +1,86 @@
+import functools
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, colorchooser, filedialog
 from pathlib import Path
+from types import MappingProxyType
 
-from slideshow.gui.helpers import wide_messagebox
+from slideshow.gui.helpers import wide_messagebox, dialog_initial_dir
+
+
+# Common font file extensions for the font file dialog
+_FONT_FILETYPES = (
+    ("Font Files", "*.ttf *.otf *.ttc"),
+    ("TrueType Fonts", "*.ttf"),
+    ("OpenType Fonts", "*.otf"),
+    ("TrueType Collections", "*.ttc"),
+    ("All Files", "*.*")
+)
+
+# Combobox choices
+_EASING_VALUES = ("linear", "quad", "cubic", "back")
+_FOLD_VALUES = ("", "left", "right", "up", "down", "centerhoriz", "centervert",
+                "slide_left", "slide_right", "multileft", "multiright")
+_WEIGHT_VALUES = ("light", "normal", "bold")
+_AXIS_VALUES = ("x", "y", "z")
+_RESOLUTION_VALUES = ("1920x1080", "1280x720", "3840x2160", "2560x1440")
+_FPS_VALUES = (24, 25, 30, 50, 60)
+
+# Shared Spinbox options for the color alpha and shadow offset fields
+_ALPHA_SPIN_OPTIONS = {"from_": 0, "to": 255, "width": 6}
+_OFFSET_SPIN_OPTIONS = {"from_": -20, "to": 20, "width": 5}
+
+# Descriptions for key transitions that don't provide their own
+_TRANSITION_DESCRIPTIONS = {
+    'fade': 'Simple cross-fade between slides',
+    'origami': 'Advanced paper-folding animation with realistic lighting',
+    'wipe': 'Slide wipe transition',
+    'push': 'Push transition effect'
+}
+
+# Used when the transitions package can't be queried
+_FALLBACK_TRANSITION_OPTIONS = MappingProxyType({
+    'fade': MappingProxyType({'display_name': 'Fade', 'description': 'Simple cross-fade between slides'}),
+    'origami': MappingProxyType({'display_name': 'Origami', 'description': 'Advanced paper-folding animation'})
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _build_transition_options(available):
+    """Build the read-only options mapping for a tuple of (name, display_name, description)
+    
+    Cached on its argument, so reopening the dialog reuses the mapping until
+    the set of available transitions changes (see reset_available_transitions).
+    """
+    options = {}
+    for name, display_name, description in available:
+        options[name] = MappingProxyType({
+            'display_name': display_name,
+            'description': description or _TRANSITION_DESCRIPTIONS.get(name, '')
+        })
+    return MappingProxyType(options)
+
+
+def _to_hex_color(rgba):
+    """[r, g, b, a] -> "#rrggbb" (alpha is edited separately)"""
+    return "#{:02x}{:02x}{:02x}".format(*rgba[:3])
 
 
 class SettingsDialog:
     """Comprehensive settings dialog for transitions, titles, and advanced options"""
     
+    # Config keys edited by this dialog (and restored by Reset to Defaults)
+    SETTINGS_KEYS = (
+        "transition_type", "origami_easing", "origami_lighting", "origami_fold",
+        "intro_title",
+        "resolution", "fps", "hardware_acceleration", "temp_directory",
+        "keep_intermediate_frames", "ffmpeg_cache_enabled", "ffmpeg_cache_dir",
+    )
+    
     def __init__(self, parent):
         self.parent = parent
         self.config_data = parent.config_data.copy()
+        self._var_bindings = []  # (var, config key path, fallback, convert) for built tabs
+        self._last_intro_state = None  # Enabled state last applied to the title controls
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -23,6 +93,10 @@ class SettingsDialog:
         # Set minimum size to prevent clipping
         self.dialog.minsize(900, 600)  # Increased minimum width from 750 to 900
         
+        # Keystroke validator for integer Spinboxes, registered with Tcl once
+        self._int_vcmd = (self.dialog.register(self._validate_int), '%P')
+        self._int_spin_options = {"validate": "key", "validatecommand": self._int_vcmd}
+        
         # Center the dialog
         self._center_dialog()
         
@@ -79,35 +153,95 @@ class SettingsDialog:
         ttk.Button(button_frame, text="Reset to Defaults", command=self._reset_clicked).pack(side=tk.LEFT)
     
     def _init_tabs(self):
-        """Initialize all tab content"""
-        self._create_transition_settings()
-        self._create_title_settings()
-        self._create_advanced_settings()
+        """Build the selected tab now and each other tab the first time it is shown"""
+        self._tab_builders = {
+            self.advanced_frame: self._create_advanced_settings,
+            self.transition_frame: self._create_transition_settings,
+            self.title_frame: self._create_title_settings,
+        }
+        self._built = set()  # Tab frames whose controls exist
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
     
-    def _create_transition_settings(self):
-        """Create transition settings controls"""
-        frame = self.transition_frame
-        
-        # Create scrollable frame
+    def _on_tab_changed(self, event=None):
+        """Create the selected tab's controls on first display"""
+        frame = self.notebook.nametowidget(self.notebook.select())
+        if frame not in self._built:
+            self._built.add(frame)
+            self._tab_builders[frame]()
+    
+    def _make_scrollable(self, frame):
+        """Return a content frame for a tab, adding a Canvas + Scrollbar only on overflow
+        
+        Most tabs fit the dialog, so the Canvas is created the first time the
+        content's requested height exceeds the tab's height (on open, resize
+        or when the content grows).
+        """
+        content = ttk.Frame(frame)
+        content.pack(anchor="nw")
+        wrapped = False
+        
+        def check_overflow(event=None):
+            nonlocal wrapped
+            if wrapped or frame.winfo_height() <= 1:
+                return  # Already scrollable, or not laid out yet
+            if content.winfo_reqheight() > frame.winfo_height():
+                wrapped = True
+                self._wrap_in_canvas(frame, content)
+        
+        frame.bind("<Configure>", check_overflow, add="+")
+        content.bind("<Configure>", check_overflow, add="+")
+        return content
+    
+    def _wrap_in_canvas(self, frame, content):
+        """Move a tab's content frame into a scrolling Canvas"""
+        content.pack_forget()
         canvas = tk.Canvas(frame)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        # Bursts of <Configure> (e.g. while widgets are created) are coalesced
+        # into one bbox("all") per idle cycle; the canvas is only reconfigured
+        # when the bbox actually changed
+        pending = False
+        last_bbox = None
+        
+        def update_scrollregion():
+            nonlocal pending, last_bbox
+            pending = False
+            bbox = canvas.bbox("all")
+            if bbox != last_bbox:
+                last_bbox = bbox
+                canvas.configure(scrollregion=bbox)
+        
+        def on_content_configure(event=None):
+            nonlocal pending
+            if not pending:
+                pending = True
+                canvas.after_idle(update_scrollregion)
+        
+        content.bind("<Configure>", on_content_configure, add="+")
+        
+        # content is a child of frame (the canvas's parent), which create_window allows;
+        # raise it above the canvas, which was created later
+        canvas.create_window((0, 0), window=content, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+        content.lift(canvas)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        on_content_configure()
+    
+    def _create_transition_settings(self):
+        """Create transition settings controls"""
+        frame = self.transition_frame
+        
+        # Content frame; scrolling is only added if it outgrows the tab
+        scrollable_frame = self._make_scrollable(frame)
         
         # Transition Type Selection
         ttk.Label(scrollable_frame, text="Transition Type:", font=("Arial", 12, "bold")).grid(row=0, column=0, sticky="w", pady=(0, 10))
         
-        self.transition_type_var = tk.StringVar(value=self.config_data.get("transition_type", "fade"))
+        self.transition_type_var = self._setting_var(tk.StringVar, ("transition_type",), "fade")
         
         # Get available transitions
         self.transition_options = self._get_transition_options()
@@ -137,24 +271,22 @@ class SettingsDialog:
         
         # Easing Function
         ttk.Label(scrollable_frame, text="Animation Easing:").grid(row=row, column=0, sticky="w")
-        self.easing_var = tk.StringVar(value=self.config_data.get("origami_easing", "quad"))
+        self.easing_var = self._setting_var(tk.StringVar, ("origami_easing",), "quad")
         easing_combo = ttk.Combobox(scrollable_frame, textvariable=self.easing_var, 
-                                   values=["linear", "quad", "cubic", "back"], state="readonly", width=20)
+                                   values=_EASING_VALUES, state="readonly", width=20)
         easing_combo.grid(row=row, column=1, sticky="w", padx=(10, 0))
         row += 1
         
         # Lighting
-        self.lighting_var = tk.BooleanVar(value=self.config_data.get("origami_lighting", True))
+        self.lighting_var = self._setting_var(tk.BooleanVar, ("origami_lighting",), True)
         ttk.Checkbutton(scrollable_frame, text="Enable realistic lighting", variable=self.lighting_var).grid(row=row, column=0, columnspan=2, sticky="w", pady=5)
         row += 1
         
         # Fold Direction (for origami)
         ttk.Label(scrollable_frame, text="Fold Direction:").grid(row=row, column=0, sticky="w")
-        self.fold_direction_var = tk.StringVar(value=self.config_data.get("origami_fold", ""))
+        self.fold_direction_var = self._setting_var(tk.StringVar, ("origami_fold",), "")
         fold_combo = ttk.Combobox(scrollable_frame, textvariable=self.fold_direction_var,
-                                 values=["", "left", "right", "up", "down", "centerhoriz", "centervert", 
-                                        "slide_left", "slide_right", "multileft", "multiright"], 
-                                 state="readonly", width=20)
+                                 values=_FOLD_VALUES, state="readonly", width=20)
         fold_combo.grid(row=row, column=1, sticky="w", padx=(10, 0))
         row += 1
         
@@ -165,29 +297,14 @@ class SettingsDialog:
         """Create title/intro settings controls"""
         frame = self.title_frame
         
-        # Create scrollable frame
-        canvas = tk.Canvas(frame)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Content frame; scrolling is only added if it outgrows the tab
+        scrollable_frame = self._make_scrollable(frame)
         
         # Configure grid weights for proper expansion in title settings
         scrollable_frame.columnconfigure(1, weight=1)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        intro_config = self.config_data.get("intro_title", {})
-        
         # Enable/Disable Intro Title
-        self.intro_enabled_var = tk.BooleanVar(value=intro_config.get("enabled", False))
+        self.intro_enabled_var = self._setting_var(tk.BooleanVar, ("intro_title", "enabled"), False)
         ttk.Checkbutton(scrollable_frame, text="Enable Intro Title", variable=self.intro_enabled_var,
                        command=self._toggle_intro_controls).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 10))
         
@@ -197,8 +314,10 @@ class SettingsDialog:
         text_frame.grid(row=1, column=1, sticky="ew", padx=(10, 0), pady=(0, 5))
         text_frame.columnconfigure(0, weight=1)  # Make text widget expand
         
-        # Create text widget with scrollbar for multi-line input
-        self.title_text_widget = tk.Text(text_frame, width=50, height=4, wrap=tk.WORD)
+        # Create text widget with scrollbar for multi-line input (no undo history
+        # for a few lines of title text)
+        self.title_text_widget = tk.Text(text_frame, width=50, height=4, wrap=tk.WORD,
+                                         undo=False, autoseparators=False, maxundo=0)
         text_scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.title_text_widget.yview)
         self.title_text_widget.configure(yscrollcommand=text_scrollbar.set)
         
@@ -206,26 +325,21 @@ class SettingsDialog:
         text_scrollbar.grid(row=0, column=1, sticky="ns")
         
         # Insert current text
-        current_text = intro_config.get("text", "").replace('\\n', '\n')
-        self.title_text_widget.insert(1.0, current_text)
+        self._set_title_text()
         
         # Add helper label
         helper_label = ttk.Label(scrollable_frame, text="(Use Enter for new lines)", foreground="gray")
         helper_label.grid(row=2, column=1, sticky="w", padx=(10, 0))
         
         # Duration
-        ttk.Label(scrollable_frame, text="Duration (seconds):").grid(row=3, column=0, sticky="w")
-        self.title_duration_var = tk.DoubleVar(value=intro_config.get("duration", 5.0))
-        duration_spin = ttk.Spinbox(scrollable_frame, from_=1.0, to=30.0, increment=0.5, 
-                                   textvariable=self.title_duration_var, width=10)
-        duration_spin.grid(row=3, column=1, sticky="w", padx=(10, 0))
+        self.title_duration_var = self._setting_var(tk.DoubleVar, ("intro_title", "duration"), 5.0)
+        duration_spin = self._add_spin_row(scrollable_frame, 3, "Duration (seconds):", self.title_duration_var,
+                                           from_=1.0, to=30.0, increment=0.5)
         
         # Line Spacing
-        ttk.Label(scrollable_frame, text="Line Spacing:").grid(row=4, column=0, sticky="w")
-        self.line_spacing_var = tk.DoubleVar(value=intro_config.get("line_spacing", 1.2))
-        spacing_spin = ttk.Spinbox(scrollable_frame, from_=0.8, to=3.0, increment=0.1, 
-                                  textvariable=self.line_spacing_var, width=10, format="%.1f")
-        spacing_spin.grid(row=4, column=1, sticky="w", padx=(10, 0))
+        self.line_spacing_var = self._setting_var(tk.DoubleVar, ("intro_title", "line_spacing"), 1.2)
+        spacing_spin = self._add_spin_row(scrollable_frame, 4, "Line Spacing:", self.line_spacing_var,
+                                          from_=0.8, to=3.0, increment=0.1, format="%.1f")
         
         # Font Settings Section
         ttk.Label(scrollable_frame, text="Font:", font=("Arial", 10, "bold")).grid(row=5, column=0, sticky="w", pady=(10, 5))
@@ -236,91 +350,64 @@ class SettingsDialog:
         font_path_frame.grid(row=6, column=1, sticky="ew", padx=(10, 0))
         font_path_frame.columnconfigure(0, weight=1)  # Make entry expand
         
-        self.font_path_var = tk.StringVar(value=intro_config.get("font_path", ""))
+        self.font_path_var = self._setting_var(tk.StringVar, ("intro_title", "font_path"), "")
         font_path_entry = ttk.Entry(font_path_frame, textvariable=self.font_path_var, width=45)
         font_path_entry.grid(row=0, column=0, sticky="ew")
         ttk.Button(font_path_frame, text="Browse", command=self._browse_font_file).grid(row=0, column=1, padx=(5, 0))
         
         # Font Size
-        ttk.Label(scrollable_frame, text="Font Size:").grid(row=7, column=0, sticky="w")
-        self.font_size_var = tk.IntVar(value=intro_config.get("font_size", 120))
-        font_spin = ttk.Spinbox(scrollable_frame, from_=20, to=300, increment=10, 
-                               textvariable=self.font_size_var, width=10)
-        font_spin.grid(row=7, column=1, sticky="w", padx=(10, 0))
+        self.font_size_var = self._setting_var(tk.IntVar, ("intro_title", "font_size"), 120)
+        font_spin = self._add_spin_row(scrollable_frame, 7, "Font Size:", self.font_size_var,
+                                       from_=20, to=300, increment=10, **self._int_spin_options)
         
         # Font Weight
         ttk.Label(scrollable_frame, text="Font Weight:").grid(row=8, column=0, sticky="w")
-        self.font_weight_var = tk.StringVar(value=intro_config.get("font_weight", "normal"))
+        self.font_weight_var = self._setting_var(tk.StringVar, ("intro_title", "font_weight"), "normal")
         weight_combo = ttk.Combobox(scrollable_frame, textvariable=self.font_weight_var,
-                                   values=["light", "normal", "bold"], state="readonly", width=10)
+                                   values=_WEIGHT_VALUES, state="readonly", width=10)
         weight_combo.grid(row=8, column=1, sticky="w", padx=(10, 0))
         
         # Text Color
-        ttk.Label(scrollable_frame, text="Text Color (RGBA):").grid(row=9, column=0, sticky="w")
-        color_frame = ttk.Frame(scrollable_frame)
-        color_frame.grid(row=9, column=1, sticky="ew", padx=(10, 0))
-        
-        text_color = intro_config.get("text_color", [255, 255, 255, 255])
-        self.text_r_var = tk.IntVar(value=text_color[0])
-        self.text_g_var = tk.IntVar(value=text_color[1])
-        self.text_b_var = tk.IntVar(value=text_color[2])
-        self.text_a_var = tk.IntVar(value=text_color[3])
-        
-        for i, (var, label) in enumerate([(self.text_r_var, "R"), (self.text_g_var, "G"), 
-                                         (self.text_b_var, "B"), (self.text_a_var, "A")]):
-            ttk.Label(color_frame, text=f"{label}:").grid(row=0, column=i*2, sticky="w", padx=(0 if i == 0 else 5, 2))
-            ttk.Spinbox(color_frame, from_=0, to=255, textvariable=var, width=6).grid(row=0, column=i*2+1, padx=(0, 8))
+        self.text_color_var, self.text_a_var, text_color_controls = self._create_color_row(
+            scrollable_frame, 9, "Text Color:", ("intro_title", "text_color"), [255, 255, 255, 255])
         
         # Shadow Color
-        ttk.Label(scrollable_frame, text="Shadow Color (RGBA):").grid(row=10, column=0, sticky="w")
-        shadow_frame = ttk.Frame(scrollable_frame)
-        shadow_frame.grid(row=10, column=1, sticky="ew", padx=(10, 0))
-        
-        shadow_color = intro_config.get("shadow_color", [0, 0, 0, 180])
-        self.shadow_r_var = tk.IntVar(value=shadow_color[0])
-        self.shadow_g_var = tk.IntVar(value=shadow_color[1])
-        self.shadow_b_var = tk.IntVar(value=shadow_color[2])
-        self.shadow_a_var = tk.IntVar(value=shadow_color[3])
-        
-        for i, (var, label) in enumerate([(self.shadow_r_var, "R"), (self.shadow_g_var, "G"), 
-                                         (self.shadow_b_var, "B"), (self.shadow_a_var, "A")]):
-            ttk.Label(shadow_frame, text=f"{label}:").grid(row=0, column=i*2, sticky="w", padx=(0 if i == 0 else 5, 2))
-            ttk.Spinbox(shadow_frame, from_=0, to=255, textvariable=var, width=6).grid(row=0, column=i*2+1, padx=(0, 8))
+        self.shadow_color_var, self.shadow_a_var, shadow_color_controls = self._create_color_row(
+            scrollable_frame, 10, "Shadow Color:", ("intro_title", "shadow_color"), [0, 0, 0, 180])
         
         # Shadow Offset
         ttk.Label(scrollable_frame, text="Shadow Offset (X, Y):").grid(row=11, column=0, sticky="w")
         offset_frame = ttk.Frame(scrollable_frame)
         offset_frame.grid(row=11, column=1, sticky="w", padx=(10, 0))
         
-        shadow_offset = intro_config.get("shadow_offset", [4, 4])
-        self.shadow_x_var = tk.IntVar(value=shadow_offset[0])
-        self.shadow_y_var = tk.IntVar(value=shadow_offset[1])
+        self.shadow_x_var = self._setting_var(tk.IntVar, ("intro_title", "shadow_offset"), [4, 4], lambda o: o[0])
+        self.shadow_y_var = self._setting_var(tk.IntVar, ("intro_title", "shadow_offset"), [4, 4], lambda o: o[1])
         
         ttk.Label(offset_frame, text="X:").grid(row=0, column=0, sticky="w")
-        ttk.Spinbox(offset_frame, from_=-20, to=20, textvariable=self.shadow_x_var, width=5).grid(row=0, column=1, padx=(2, 10))
+        offset_x_spin = ttk.Spinbox(offset_frame, textvariable=self.shadow_x_var,
+                                    **_OFFSET_SPIN_OPTIONS, **self._int_spin_options)
+        offset_x_spin.grid(row=0, column=1, padx=(2, 10))
         ttk.Label(offset_frame, text="Y:").grid(row=0, column=2, sticky="w")
-        ttk.Spinbox(offset_frame, from_=-20, to=20, textvariable=self.shadow_y_var, width=5).grid(row=0, column=3, padx=(2, 0))
+        offset_y_spin = ttk.Spinbox(offset_frame, textvariable=self.shadow_y_var,
+                                    **_OFFSET_SPIN_OPTIONS, **self._int_spin_options)
+        offset_y_spin.grid(row=0, column=3, padx=(2, 0))
         
         # Rotation Settings
         ttk.Label(scrollable_frame, text="Rotation:", font=("Arial", 10, "bold")).grid(row=12, column=0, sticky="w", pady=(20, 5))
         
-        rotation_config = intro_config.get("rotation", {})
-        
         ttk.Label(scrollable_frame, text="Rotation Axis:").grid(row=13, column=0, sticky="w")
-        self.rotation_axis_var = tk.StringVar(value=rotation_config.get("axis", "y"))
+        self.rotation_axis_var = self._setting_var(tk.StringVar, ("intro_title", "rotation", "axis"), "y")
         axis_combo = ttk.Combobox(scrollable_frame, textvariable=self.rotation_axis_var,
-                                 values=["x", "y", "z"], state="readonly", width=10)
+                                 values=_AXIS_VALUES, state="readonly", width=10)
         axis_combo.grid(row=13, column=1, sticky="w", padx=(10, 0))
         
-        self.rotation_clockwise_var = tk.BooleanVar(value=rotation_config.get("clockwise", True))
+        self.rotation_clockwise_var = self._setting_var(tk.BooleanVar, ("intro_title", "rotation", "clockwise"), True)
         ttk.Checkbutton(scrollable_frame, text="Clockwise rotation", variable=self.rotation_clockwise_var).grid(row=14, column=0, columnspan=2, sticky="w", pady=5)
         
-        # Store title controls for enable/disable
-        self.title_controls = [self.title_text_widget, duration_spin, spacing_spin, font_path_entry, font_spin, weight_combo] + \
-                             [child for child in color_frame.winfo_children() if isinstance(child, ttk.Spinbox)] + \
-                             [child for child in shadow_frame.winfo_children() if isinstance(child, ttk.Spinbox)] + \
-                             [child for child in offset_frame.winfo_children() if isinstance(child, ttk.Spinbox)] + \
-                             [axis_combo]
+        # Store title controls for enable/disable (ttk widgets; the Text widget is handled separately)
+        self.title_controls = [duration_spin, spacing_spin, font_path_entry, font_spin, weight_combo,
+                               *text_color_controls, *shadow_color_controls,
+                               offset_x_spin, offset_y_spin, axis_combo]
         
         # Initial state
         self._toggle_intro_controls()
@@ -329,39 +416,26 @@ class SettingsDialog:
         """Create advanced settings controls"""
         frame = self.advanced_frame
         
-        # Create scrollable frame
-        canvas = tk.Canvas(frame)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Content frame; scrolling is only added if it outgrows the tab
+        scrollable_frame = self._make_scrollable(frame)
         
         # Video Quality Settings
         ttk.Label(scrollable_frame, text="Video Quality:", font=("Arial", 12, "bold")).grid(row=0, column=0, sticky="w", pady=(0, 10))
         
         # Resolution
         ttk.Label(scrollable_frame, text="Resolution:").grid(row=1, column=0, sticky="w")
-        current_res = self.config_data.get("resolution", [1920, 1080])
-        self.resolution_var = tk.StringVar(value=f"{current_res[0]}x{current_res[1]}")
+        self.resolution_var = self._setting_var(tk.StringVar, ("resolution",), [1920, 1080],
+                                                lambda res: f"{res[0]}x{res[1]}")
         res_combo = ttk.Combobox(scrollable_frame, textvariable=self.resolution_var,
-                                values=["1920x1080", "1280x720", "3840x2160", "2560x1440"], 
+                                values=_RESOLUTION_VALUES, 
                                 state="readonly", width=15)
         res_combo.grid(row=1, column=1, sticky="w", padx=(10, 0))
         
         # FPS
         ttk.Label(scrollable_frame, text="Frame Rate (FPS):").grid(row=2, column=0, sticky="w")
-        self.fps_var = tk.IntVar(value=self.config_data.get("fps", 30))
+        self.fps_var = self._setting_var(tk.IntVar, ("fps",), 30)
         fps_combo = ttk.Combobox(scrollable_frame, textvariable=self.fps_var,
-                                values=[24, 25, 30, 50, 60], state="readonly", width=10)
+                                values=_FPS_VALUES, state="readonly", width=10)
         fps_combo.grid(row=2, column=1, sticky="w", padx=(10, 0))
         
         # Performance Settings
@@ -369,13 +443,13 @@ class SettingsDialog:
         ttk.Label(scrollable_frame, text="Performance:", font=("Arial", 12, "bold")).grid(row=4, column=0, sticky="w", pady=(0, 10))
         
         # Hardware Acceleration
-        self.hw_accel_var = tk.BooleanVar(value=self.config_data.get("hardware_acceleration", False))
+        self.hw_accel_var = self._setting_var(tk.BooleanVar, ("hardware_acceleration",), False)
         ttk.Checkbutton(scrollable_frame, text="Enable hardware acceleration (experimental)", 
                        variable=self.hw_accel_var).grid(row=5, column=0, columnspan=2, sticky="w")
         
         # Temp Directory
         ttk.Label(scrollable_frame, text="Temporary Directory:").grid(row=6, column=0, sticky="w", pady=(10, 0))
-        self.temp_dir_var = tk.StringVar(value=self.config_data.get("temp_directory", ""))
+        self.temp_dir_var = self._setting_var(tk.StringVar, ("temp_directory",), "")
         temp_frame = ttk.Frame(scrollable_frame)
         temp_frame.grid(row=6, column=1, sticky="w", padx=(10, 0), pady=(10, 0))
         ttk.Entry(temp_frame, textvariable=self.temp_dir_var, width=30).grid(row=0, column=0)
@@ -385,7 +459,7 @@ class SettingsDialog:
         ttk.Separator(scrollable_frame, orient="horizontal").grid(row=7, column=0, columnspan=2, sticky="ew", pady=20)
         ttk.Label(scrollable_frame, text="Cleanup:", font=("Arial", 12, "bold")).grid(row=8, column=0, sticky="w", pady=(0, 10))
         
-        self.keep_frames_var = tk.BooleanVar(value=self.config_data.get("keep_intermediate_frames", False))
+        self.keep_frames_var = self._setting_var(tk.BooleanVar, ("keep_intermediate_frames",), False)
         ttk.Checkbutton(scrollable_frame, text="Keep intermediate frames for debugging (required for video editor)", 
                        variable=self.keep_frames_var).grid(row=9, column=0, columnspan=2, sticky="w")
         
@@ -393,14 +467,14 @@ class SettingsDialog:
         ttk.Separator(scrollable_frame, orient="horizontal").grid(row=11, column=0, columnspan=2, sticky="ew", pady=20)
         ttk.Label(scrollable_frame, text="FFmpeg Cache:", font=("Arial", 12, "bold")).grid(row=12, column=0, sticky="w", pady=(0, 10))
         
-        self.ffmpeg_cache_enabled_var = tk.BooleanVar(value=self.config_data.get("ffmpeg_cache_enabled", True))
+        self.ffmpeg_cache_enabled_var = self._setting_var(tk.BooleanVar, ("ffmpeg_cache_enabled",), True)
         ttk.Checkbutton(scrollable_frame, text="Enable FFmpeg caching (improves performance)", 
                        variable=self.ffmpeg_cache_enabled_var,
                        command=self._toggle_cache_controls).grid(row=13, column=0, columnspan=2, sticky="w")
         
         # Cache Directory
         ttk.Label(scrollable_frame, text="Cache Directory:").grid(row=14, column=0, sticky="w", pady=(10, 0))
-        self.ffmpeg_cache_dir_var = tk.StringVar(value=self.config_data.get("ffmpeg_cache_dir", ""))
+        self.ffmpeg_cache_dir_var = self._setting_var(tk.StringVar, ("ffmpeg_cache_dir",), "")
         cache_frame = ttk.Frame(scrollable_frame)
         cache_frame.grid(row=14, column=1, sticky="w", padx=(10, 0), pady=(10, 0))
         self.cache_dir_entry = ttk.Entry(cache_frame, textvariable=self.ffmpeg_cache_dir_var, width=30)
@@ -431,63 +505,119 @@ class SettingsDialog:
         # Set initial state of cache controls
         self._toggle_cache_controls()
     
-    def _get_transition_options(self):
-        """Get available transition options with descriptions"""
+    @staticmethod
+    def _get_transition_options():
+        """Get available transition options with descriptions (a read-only mapping)"""
         try:
             from slideshow.transitions import list_available_transitions
             available = list_available_transitions()
-            
-            options = {}
-            for trans in available:
-                options[trans['name']] = {
-                    'display_name': trans['display_name'],
-                    'description': trans.get('description', '')
-                }
-            
-            # Add manual descriptions for key transitions
-            descriptions = {
-                'fade': 'Simple cross-fade between slides',
-                'origami': 'Advanced paper-folding animation with realistic lighting',
-                'wipe': 'Slide wipe transition',
-                'push': 'Push transition effect'
-            }
-            
-            for name, desc in descriptions.items():
-                if name in options and not options[name]['description']:
-                    options[name]['description'] = desc
-            
-            return options
+            return _build_transition_options(tuple(
+                (trans['name'], trans['display_name'], trans.get('description', ''))
+                for trans in available
+            ))
         except:
             # Fallback
-            return {
-                'fade': {'display_name': 'Fade', 'description': 'Simple cross-fade between slides'},
-                'origami': {'display_name': 'Origami', 'description': 'Advanced paper-folding animation'}
-            }
+            return _FALLBACK_TRANSITION_OPTIONS
+    
+    def _config_value(self, path, fallback):
+        """Look up a (possibly nested) key path in config_data, or return fallback"""
+        value = self.config_data
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                return fallback
+            value = value[key]
+        return value
+    
+    def _setting_var(self, var_class, path, fallback, convert=None):
+        """Create a Tk variable holding the config value at path and remember the binding
+        
+        The binding lets Reset to Defaults update the variable in place.
+        """
+        value = self._config_value(path, fallback)
+        var = var_class(value=convert(value) if convert else value)
+        self._var_bindings.append((var, path, fallback, convert))
+        return var
+    
+    def _set_title_text(self):
+        """Show the configured intro text (stored with literal \\n) in the title Text widget"""
+        text = self._config_value(("intro_title", "text"), "")
+        if '\\n' in text:
+            text = text.replace('\\n', '\n')
+        self.title_text_widget.delete(1.0, tk.END)
+        self.title_text_widget.insert(1.0, text)
+    
+    @staticmethod
+    def _validate_int(proposed):
+        """Spinbox validatecommand: allow only an optionally signed integer (or empty while typing)"""
+        digits = proposed[1:] if proposed.startswith("-") else proposed
+        return digits == "" or digits.isdigit()
+    
+    @staticmethod
+    def _add_spin_row(parent, row, label, variable, **spin_options):
+        """Grid a label and a Spinbox bound to variable on one settings row; returns the Spinbox"""
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w")
+        spin = ttk.Spinbox(parent, textvariable=variable, width=10, **spin_options)
+        spin.grid(row=row, column=1, sticky="w", padx=(10, 0))
+        return spin
+    
+    def _create_color_row(self, parent, row, label, path, fallback):
+        """Create a color swatch, Choose button and alpha Spinbox for an [r, g, b, a] setting
+        
+        Returns:
+            (color_var holding "#rrggbb", alpha_var, controls to enable/disable)
+        """
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky="w")
+        color_frame = ttk.Frame(parent)
+        color_frame.grid(row=row, column=1, sticky="ew", padx=(10, 0))
+        
+        color_var = self._setting_var(tk.StringVar, path, fallback, _to_hex_color)
+        alpha_var = self._setting_var(tk.IntVar, path, fallback, lambda rgba: rgba[3])
+        
+        swatch = tk.Frame(color_frame, width=24, height=16, bg=color_var.get(),
+                          highlightthickness=1, highlightbackground="gray")
+        swatch.grid(row=0, column=0, padx=(0, 5))
+        # The swatch follows the variable, whether set by the chooser or a reset
+        color_var.trace_add('write', lambda *args: swatch.configure(bg=color_var.get()))
+        choose_btn = ttk.Button(color_frame, text="Choose...",
+                                command=lambda: self._pick_color(color_var))
+        choose_btn.grid(row=0, column=1, padx=(0, 10))
+        ttk.Label(color_frame, text="Alpha:").grid(row=0, column=2, sticky="w", padx=(0, 2))
+        alpha_spin = ttk.Spinbox(color_frame, textvariable=alpha_var,
+                                 **_ALPHA_SPIN_OPTIONS, **self._int_spin_options)
+        alpha_spin.grid(row=0, column=3)
+        
+        return color_var, alpha_var, [choose_btn, alpha_spin]
+    
+    def _pick_color(self, color_var):
+        """Open the system color chooser and store the chosen color"""
+        _, hex_color = colorchooser.askcolor(initialcolor=color_var.get(), parent=self.dialog)
+        if hex_color:
+            color_var.set(hex_color)
+    
+    @staticmethod
+    def _hex_to_rgba(hex_color, alpha):
+        """Convert "#rrggbb" plus an alpha value to an (r, g, b, a) tuple (saved as a JSON array)"""
+        return (int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16), alpha)
     
     def _toggle_intro_controls(self):
         """Enable/disable intro title controls based on checkbox"""
-        state = "normal" if self.intro_enabled_var.get() else "disabled"
+        enabled = self.intro_enabled_var.get()
+        if enabled == self._last_intro_state:
+            return
+        self._last_intro_state = enabled
+        self.title_text_widget.configure(state="normal" if enabled else "disabled")
+        # ttk state flags only touch 'disabled', so readonly comboboxes stay readonly
+        state_spec = ["!disabled"] if enabled else ["disabled"]
         for control in self.title_controls:
-            if hasattr(control, 'configure'):
-                control.configure(state=state)
+            control.state(state_spec)
     
     def _browse_font_file(self):
         """Browse for font file"""
-        from tkinter import filedialog
         from slideshow.config import Config
         
-        # Common font file extensions
-        filetypes = [
-            ("Font Files", "*.ttf *.otf *.ttc"),
-            ("TrueType Fonts", "*.ttf"),
-            ("OpenType Fonts", "*.otf"), 
-            ("TrueType Collections", "*.ttc"),
-            ("All Files", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="Select Font File",
-            filetypes=filetypes,
+            filetypes=_FONT_FILETYPES,
             initialdir=Config.instance().get_font_initial_dir()
         )
         
@@ -496,20 +626,14 @@ class SettingsDialog:
     
     def _browse_temp_dir(self):
         """Browse for temporary directory"""
-        import os
-        from tkinter import filedialog
-        current_dir = self.temp_dir_var.get()
-        initial_dir = current_dir if current_dir else os.path.expanduser('~')
+        initial_dir = dialog_initial_dir(self.temp_dir_var.get())
         directory = filedialog.askdirectory(initialdir=initial_dir)
         if directory:
             self.temp_dir_var.set(directory)
     
     def _browse_cache_dir(self):
         """Browse for FFmpeg cache directory"""
-        import os
-        from tkinter import filedialog
-        current_dir = self.ffmpeg_cache_dir_var.get()
-        initial_dir = current_dir if current_dir else os.path.expanduser('~')
+        initial_dir = dialog_initial_dir(self.ffmpeg_cache_dir_var.get())
         directory = filedialog.askdirectory(initialdir=initial_dir)
         if directory:
             self.ffmpeg_cache_dir_var.set(directory)
@@ -917,17 +1041,48 @@ Parameters:
             messagebox.showerror("Error", f"Failed to browse cache contents:\\n{str(e)}")
     
     def _apply_settings(self):
-        """Apply current settings to config"""
+        """Apply current settings to config
+        
+        Tabs that were never opened have no controls; their keys keep the
+        values copied from the parent's config.
+        """
         # Basic transition settings
+        if self.transition_frame in self._built:
+            self._apply_transition_settings()
+        
+        # Title settings
+        if self.title_frame in self._built:
+            self._apply_title_settings()
+        
+        # Advanced settings
+        if self.advanced_frame in self._built:
+            self._apply_advanced_settings()
+        
+        # Update parent's config and GUI
+        self.parent.config_data = self.config_data
+        
+        # Update transition combo in main GUI if needed
+        if hasattr(self.parent, 'transition_var'):
+            self.parent.transition_var.set(self.config_data.get("transition_type", "fade"))
+        
+        # Go through the main window's debounced auto-save: repeated Apply clicks
+        # collapse into one write, made after the controls above are updated
+        self.parent._schedule_autosave()
+    
+    def _apply_transition_settings(self):
+        """Copy the Transitions tab controls into config_data"""
         self.config_data["transition_type"] = self.transition_type_var.get()
         self.config_data["origami_easing"] = self.easing_var.get()
         self.config_data["origami_lighting"] = self.lighting_var.get()
         self.config_data["origami_fold"] = self.fold_direction_var.get()
-        
-        # Title settings
-        title_text = self.title_text_widget.get(1.0, tk.END).strip()
-        # Convert actual newlines to \\n for JSON storage
-        title_text = title_text.replace('\n', '\\n')
+    
+    def _apply_title_settings(self):
+        """Copy the Title/Intro tab controls into config_data"""
+        # "end-1c" leaves out the newline Tk always keeps at the end
+        title_text = self.title_text_widget.get(1.0, "end-1c").strip()
+        # Convert actual newlines to \\n for JSON storage (most titles are one line)
+        if '\n' in title_text:
+            title_text = title_text.replace('\n', '\\n')
         
         intro_config = {
             "enabled": self.intro_enabled_var.get(),
@@ -937,20 +1092,20 @@ Parameters:
             "font_size": self.font_size_var.get(),
             "font_weight": self.font_weight_var.get(),
             "line_spacing": self.line_spacing_var.get(),
-            "text_color": [self.text_r_var.get(), self.text_g_var.get(), self.text_b_var.get(), self.text_a_var.get()],
-            "shadow_color": [self.shadow_r_var.get(), self.shadow_g_var.get(), self.shadow_b_var.get(), self.shadow_a_var.get()],
-            "shadow_offset": [self.shadow_x_var.get(), self.shadow_y_var.get()],
+            "text_color": self._hex_to_rgba(self.text_color_var.get(), self.text_a_var.get()),
+            "shadow_color": self._hex_to_rgba(self.shadow_color_var.get(), self.shadow_a_var.get()),
+            "shadow_offset": (self.shadow_x_var.get(), self.shadow_y_var.get()),
             "rotation": {
                 "axis": self.rotation_axis_var.get(),
                 "clockwise": self.rotation_clockwise_var.get()
             }
         }
         self.config_data["intro_title"] = intro_config
-        
-        # Advanced settings
-        res_str = self.resolution_var.get()
-        width, height = map(int, res_str.split('x'))
-        self.config_data["resolution"] = [width, height]
+    
+    def _apply_advanced_settings(self):
+        """Copy the Advanced tab controls into config_data"""
+        width, height = map(int, self.resolution_var.get().split('x', 1))
+        self.config_data["resolution"] = (width, height)
         self.config_data["fps"] = self.fps_var.get()
         self.config_data["hardware_acceleration"] = self.hw_accel_var.get()
         self.config_data["temp_directory"] = self.temp_dir_var.get()
@@ -959,25 +1114,37 @@ Parameters:
         # FFmpeg cache settings
         self.config_data["ffmpeg_cache_enabled"] = self.ffmpeg_cache_enabled_var.get()
         self.config_data["ffmpeg_cache_dir"] = self.ffmpeg_cache_dir_var.get().strip()
-        
-        # Update parent's config and GUI
-        self.parent.config_data = self.config_data
-        self.parent._auto_save_config()
-        
-        # Update transition combo in main GUI if needed
-        if hasattr(self.parent, 'transition_var'):
-            self.parent.transition_var.set(self.config_data["transition_type"])
     
     def _reset_clicked(self):
         """Reset all settings to defaults"""
-        from slideshow.config import DEFAULT_CONFIG
+        from slideshow.config import Config
         result = messagebox.askyesno("Reset Settings", 
                                    "This will reset all settings to their default values. Continue?")
-        if result:
-            self.config_data = DEFAULT_CONFIG.copy()
-            self.dialog.destroy()
-            # Reopen with defaults
-            SettingsDialog(self.parent)
+        if not result:
+            return
+        
+        # Restore this dialog's keys; a key without a default falls back to the
+        # same value the controls use when it's missing
+        defaults = Config.default_config()
+        for key in self.SETTINGS_KEYS:
+            if key in defaults:
+                self.config_data[key] = defaults[key]
+            else:
+                self.config_data.pop(key, None)
+        
+        # Update the controls of tabs already built; the others are built from config_data
+        for var, path, fallback, convert in self._var_bindings:
+            value = self._config_value(path, fallback)
+            var.set(convert(value) if convert else value)
+        if self.title_frame in self._built:
+            # The Text widget must be editable to replace its content; forget the
+            # applied state so the toggle restores it
+            self.title_text_widget.configure(state="normal")
+            self._set_title_text()
+            self._last_intro_state = None
+            self._toggle_intro_controls()
+        if self.advanced_frame in self._built:
+            self._toggle_cache_controls()
     
     def _ok_clicked(self):
         """OK button clicked - apply and close"""
@@ -188,18 +188,14 @@ class Slideshow:
     def _load_slide_cache(self) -> bool:
         """Try to load slides from cache. Returns True if successful."""
         try:
-            cache_path = self._get_slide_cache_path()
-
-            if not cache_path.exists():
-                legacy_cache_path = self._get_legacy_slide_cache_path()
-                if legacy_cache_path.exists():
-                    cache_path = legacy_cache_path
-                else:
+            try:
+                slide_data = json.loads(self._get_slide_cache_path().read_bytes())
+            except FileNotFoundError:
+                try:
+                    slide_data = json.loads(self._get_legacy_slide_cache_path().read_bytes())
+                except FileNotFoundError:
                     return False
             
-            with open(cache_path, 'r') as f:
-                slide_data = json.load(f)
-            
             # Get current input folder for validation
             input_folder = Path(self.config["input_folder"])
             if not input_folder.exists():
@@ -376,8 +372,7 @@ class Slideshow:
         cache_loaded = self._load_slide_cache()
         if cache_loaded:
             self._log(f"Loaded {len(self.slides)} slides from cache")
-            # Final progress update (must come before _log_input_file_counts, as the progress
-            # message uses \r which deletes the previous log line)
+            # Final progress update
             if self.progress_callback:
                 total = len(self.slides)
                 self.progress_callback(total, total, f"Loaded {total} slides from cache")
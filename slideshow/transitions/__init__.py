@@ -3,17 +3,42 @@ Slideshow transition effects module
 
 This module provides various transition effects for slideshow videos,
 including simple fades and complex 3D origami-style transitions.
+
+Transition classes are imported on first use so that lightweight users of
+the package (e.g. the FFmpeg cache tools) don't pay for numpy/PIL/moderngl.
 """
 
-from .base_transition import BaseTransition
-from .fade_transition import FadeTransition
-from .origami_transition import OrigamiTransition
+_registry = None
+_available_transitions = None  # list_available_transitions() result, computed once
+
+
+def _get_registry():
+    """Registry of available transitions, built on first use."""
+    global _registry
+    if _registry is None:
+        from .fade_transition import FadeTransition
+        from .origami_transition import OrigamiTransition
+        _registry = {
+            'fade': FadeTransition,
+            'origami': OrigamiTransition,
+        }
+    return _registry
+
 
-# Registry of available transitions
-AVAILABLE_TRANSITIONS = {
-    'fade': FadeTransition,
-    'origami': OrigamiTransition,
-}
+def __getattr__(name):
+    """Lazily resolve the public transition classes and registry (PEP 562)."""
+    if name == 'BaseTransition':
+        from .base_transition import BaseTransition as value
+    elif name == 'FadeTransition':
+        from .fade_transition import FadeTransition as value
+    elif name == 'OrigamiTransition':
+        from .origami_transition import OrigamiTransition as value
+    elif name == 'AVAILABLE_TRANSITIONS':
+        value = _get_registry()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 def get_transition(name: str, **kwargs):
     """
@@ -29,37 +54,50 @@ def get_transition(name: str, **kwargs):
     Raises:
         ValueError: If transition name is not recognized
     """
-    if name not in AVAILABLE_TRANSITIONS:
-        available = ', '.join(AVAILABLE_TRANSITIONS.keys())
+    registry = _get_registry()
+    if name not in registry:
+        available = ', '.join(registry.keys())
         raise ValueError(f"Unknown transition '{name}'. Available: {available}")
     
-    transition_class = AVAILABLE_TRANSITIONS[name]
+    transition_class = registry[name]
     return transition_class(**kwargs)
 
 def list_available_transitions():
     """
     Get list of available transition names
     
+    Availability is checked by instantiating each transition, so the result
+    is computed once per process; callers get their own copy.
+    
     Returns:
         List of transition names that can be used
     """
-    available = []
-    for name, transition_class in AVAILABLE_TRANSITIONS.items():
-        # Test if transition dependencies are available
-        try:
-            instance = transition_class()
-            if instance.is_available():
-                available.append({
-                    'name': name,
-                    'display_name': instance.name,
-                    'description': instance.description
-                })
-        except Exception:
-            # Skip transitions that can't be instantiated
-            print(f"[Transitions] Warning: Could not check availability of {name}")
-            pass
+    global _available_transitions
+    if _available_transitions is None:
+        available = []
+        for name, transition_class in _get_registry().items():
+            # Test if transition dependencies are available
+            try:
+                instance = transition_class()
+                if instance.is_available():
+                    available.append({
+                        'name': name,
+                        'display_name': instance.name,
+                        'description': instance.description
+                    })
+            except Exception:
+                # Skip transitions that can't be instantiated
+                print(f"[Transitions] Warning: Could not check availability of {name}")
+                pass
+        _available_transitions = available
     
-    return available
+    return [dict(t) for t in _available_transitions]
+
+
+def reset_available_transitions():
+    """Forget the cached availability check (e.g. after the ffmpeg path changes)."""
+    global _available_transitions
+    _available_transitions = None
 
 __all__ = [
     'BaseTransition',
@@ -67,5 +105,6 @@ __all__ = [
     'OrigamiTransition',
     'AVAILABLE_TRANSITIONS',
     'get_transition',
-    'list_available_transitions'
+    'list_available_transitions',
+    'reset_available_transitions'
 ]
\ No newline at end of file
@@ -8,11 +8,17 @@ import hashlib
 import json
 import shutil
 import threading
+import time
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, Iterator, List, Tuple
 import os
 from slideshow.config import cfg
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - fall back to stdlib json
+
 
 class FFmpegCache:
     """
@@ -23,6 +29,7 @@ class FFmpegCache:
     
     Usage:
         1. Call configure(cache_dir) once at the start of export
+           (or initialize(cache_dir, max_bytes) to also cap the cache size)
         2. All cache operations then work automatically with zero overhead
         3. Can call configure() multiple times - it's idempotent
     
@@ -34,6 +41,7 @@ class FFmpegCache:
     Cache structure:
     cache_dir/
         metadata.json     # Cache metadata and index
+        access_log.jsonl  # Cache hits since metadata was last compacted
         clips/           # Cached video clips
             {hash}.mp4
         frames/          # Cached frame extractions  
@@ -48,6 +56,11 @@ class FFmpegCache:
     _lock = threading.RLock()
     _key_cache: Dict[str, str] = {}
     _max_key_cache_entries = 2048
+    _miss_started: Dict[str, float] = {}
+    _default_max_mb = 4096
+    _max_bytes: Optional[int] = None  # Explicit cap from initialize() for this directory; None = use config
+    _total_bytes = 0  # Running total of entry sizes, kept in step with metadata
+    _evict_to_fraction = 0.9  # Evict down to this fraction of the cap
     
     @classmethod
     def configure(cls, cache_dir: Union[str, Path]):
@@ -71,6 +84,8 @@ class FFmpegCache:
                 cls._initialized = False
                 cls._metadata = {}
                 cls._key_cache = {}
+                cls._miss_started = {}
+                cls._max_bytes = None  # An initialize() cap belongs to the old directory
             
             try:
                 cls._cache_dir.mkdir(parents=True, exist_ok=True)
@@ -88,29 +103,50 @@ class FFmpegCache:
             
             # Load or create metadata
             metadata_file = cls._cache_dir / "metadata.json"
-            if metadata_file.exists():
+            try:
+                raw = metadata_file.read_bytes()
+                cls._metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except FileNotFoundError:
+                cls._metadata = {"version": "1.0", "entries": {}, "stats": {"hits": 0, "misses": 0}}
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError):
+                # Backup corrupted file before resetting
                 try:
-                    with open(metadata_file, 'r') as f:
-                        cls._metadata = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    # Backup corrupted file before resetting
-                    try:
-                        backup = metadata_file.with_suffix('.json.bak')
-                        metadata_file.rename(backup)
-                        print(f"[FFmpegCache] Backed up corrupted metadata to {backup}")
-                    except OSError:
-                        pass
-                    cls._metadata = {"version": "1.0", "entries": {}, "stats": {"hits": 0, "misses": 0}}
-            else:
+                    backup = metadata_file.with_suffix('.json.bak')
+                    metadata_file.rename(backup)
+                    print(f"[FFmpegCache] Backed up corrupted metadata to {backup}")
+                except OSError:
+                    pass
                 cls._metadata = {"version": "1.0", "entries": {}, "stats": {"hits": 0, "misses": 0}}
             
             # Ensure stats section exists for older cache files
             if "stats" not in cls._metadata:
                 cls._metadata["stats"] = {"hits": 0, "misses": 0}
+            cls._metadata.setdefault("entries", {})
+            
+            cls._compact_access_log()
+            cls._total_bytes = sum(entry.get("size", 0) for entry in cls._metadata["entries"].values())
             
             cls._initialized = True
             cls._enabled = True
     
+    @classmethod
+    def initialize(cls, cache_dir: Union[str, Path], max_bytes: Optional[int] = None):
+        """
+        Configure the cache and optionally cap its size.
+        
+        Args:
+            cache_dir: Path to the cache directory
+            max_bytes: Maximum cache size in bytes. None uses ffmpeg_cache_max_mb
+                       from the project config. If the cache is already over the
+                       cap, entries are evicted immediately.
+        """
+        cls.configure(cache_dir)
+        
+        with cls._lock:
+            cls._max_bytes = max_bytes
+            if cls._enabled and cls._cache_dir and cls._enforce_size_limit():
+                cls._save_metadata()
+    
     @classmethod
     def auto_configure(cls):
         """
@@ -136,13 +172,68 @@ class FFmpegCache:
             # This is not fatal - the application will just skip caching
             pass
     
+    @classmethod
+    def _compact_access_log(cls):
+        """Fold hits recorded in access_log.jsonl into metadata and remove the log."""
+        log_file = cls._cache_dir / "access_log.jsonl"
+        try:
+            with open(log_file, 'r') as f:
+                lines = f.readlines()
+        except OSError:
+            return  # No hits logged since the last compaction
+        
+        entries = cls._metadata.get("entries", {})
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial line from an interrupted write
+            if not isinstance(record, dict):
+                continue
+            entry = entries.get(record.get("key"))
+            if entry is not None and record.get("ts", 0) > entry.get("last_access_ts", 0):
+                entry["last_access_ts"] = record["ts"]
+        
+        try:
+            cls._save_metadata()
+            log_file.unlink()
+        except OSError:
+            pass
+    
+    @classmethod
+    def _record_access(cls, cache_key: str):
+        """Mark an entry as just used, appending to the access log so it survives restarts."""
+        now = time.time()
+        cls._metadata["entries"][cache_key]["last_access_ts"] = now
+        try:
+            with open(cls._cache_dir / "access_log.jsonl", 'a') as f:
+                f.write(json.dumps({"key": cache_key, "ts": now}) + "\n")
+        except OSError:
+            pass
+    
+    @classmethod
+    def _drop_entry(cls, cache_key: str):
+        """Remove an entry from metadata (not from disk), keeping the size total in step."""
+        entry = cls._metadata.get("entries", {}).pop(cache_key, None)
+        if entry is not None:
+            cls._total_bytes -= entry.get("size", 0)
+    
     @classmethod
     def _save_metadata(cls):
-        """Save metadata to disk."""
+        """Save metadata to disk.
+        
+        Written to a temp file and renamed over metadata.json, so a crash
+        mid-write can't leave a truncated file behind.
+        """
         if cls._cache_dir:
             metadata_file = cls._cache_dir / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(cls._metadata, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(cls._metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(cls._metadata, indent=2).encode("utf-8")
+            tmp_file = metadata_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, metadata_file)
     
     @classmethod
     def _key_from_material(cls, cache_material: str) -> str:
@@ -158,6 +249,104 @@ class FFmpegCache:
             cls._key_cache[cache_material] = cache_key
             return cache_key
 
+    @classmethod
+    def _start_miss_timer(cls, cache_key: str):
+        """Remember when a miss happened so the following store can record its cost."""
+        if len(cls._miss_started) >= cls._max_key_cache_entries:
+            cls._miss_started.clear()
+        cls._miss_started[cache_key] = time.perf_counter()
+
+    @classmethod
+    def _stop_miss_timer(cls, cache_key: str) -> float:
+        """Seconds between the miss for cache_key and now (the FFmpeg render time)."""
+        started = cls._miss_started.pop(cache_key, None)
+        if started is None:
+            return 0.0
+        return round(time.perf_counter() - started, 3)
+
+    @classmethod
+    def _size_limit_bytes(cls) -> int:
+        """Cache size cap in bytes (0 = unlimited)."""
+        if cls._max_bytes is not None:
+            return cls._max_bytes
+        max_mb = cfg.get("ffmpeg_cache_max_mb", cls._default_max_mb)
+        try:
+            return int(float(max_mb) * 1024 * 1024)
+        except (TypeError, ValueError):
+            return 0
+    
+    @classmethod
+    def _enforce_size_limit(cls) -> int:
+        """
+        Evict entries if the cache has grown past its cap.
+        
+        The check is O(1) against the running size total. When over the cap,
+        evicts down to 90% of it so the next few stores don't evict again.
+        
+        Returns:
+            Number of bytes evicted
+        """
+        max_bytes = cls._size_limit_bytes()
+        if max_bytes <= 0 or cls._total_bytes <= max_bytes:
+            return 0
+        return cls._evict_lrbu(int(max_bytes * cls._evict_to_fraction))
+
+    @classmethod
+    def _evict_lrbu(cls, target_bytes: int) -> int:
+        """
+        Evict entries until the cache is at or below target_bytes.
+        
+        Uses a Least-Recently/Beneficially-Used policy: entries are scored by
+        idle time divided by the FFmpeg time it took to produce them, so cheap,
+        long-idle entries go first and expensive renders are kept longer.
+        
+        Returns:
+            Number of bytes evicted
+        """
+        with cls._lock:
+            entries = cls._metadata.get("entries", {})
+            # Re-total exactly here (eviction is O(n log n) anyway) to correct any drift
+            total_size = sum(entry.get("size", 0) for entry in entries.values())
+            cls._total_bytes = total_size
+            if total_size <= target_bytes:
+                return 0
+            
+            now = time.time()
+            
+            def score(item):
+                entry = item[1]
+                last_access = entry.get("last_access_ts", entry.get("last_accessed", entry.get("created", 0)))
+                return (now - last_access) / max(entry.get("miss_cost_s", 0.0), 0.01)
+            
+            evicted_bytes = 0
+            for cache_key, entry in sorted(entries.items(), key=score, reverse=True):
+                if total_size <= target_bytes:
+                    break
+                
+                if entry.get("type") == "clip":
+                    cached_file = cls._cache_dir / "clips" / f"{cache_key}.mp4"
+                elif entry.get("type") == "frame":
+                    cached_file = cls._cache_dir / "frames" / f"{cache_key}.png"
+                else:
+                    cached_file = None
+                
+                if cached_file is not None:
+                    try:
+                        cached_file.unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        continue  # Keep the entry if the file can't be removed
+                
+                size = entry.get("size", 0)
+                cls._drop_entry(cache_key)
+                total_size -= size
+                evicted_bytes += size
+            
+            stats = cls._metadata.setdefault("stats", {})
+            stats["evicted_bytes"] = stats.get("evicted_bytes", 0) + evicted_bytes
+            return evicted_bytes
+
     @classmethod
     def _generate_cache_key_legacy(cls, input_path: Path, params: Dict[str, Any]) -> str:
         """Legacy cache key format kept for compatibility with existing metadata/files."""
@@ -222,15 +411,17 @@ class FFmpegCache:
             else:
                 stats = cls._metadata.setdefault("stats", {})
                 stats["misses"] = stats.get("misses", 0) + 1
+                cls._start_miss_timer(primary_key)
                 return None
 
             # Check if cached file actually exists
             cached_file = cls._cache_dir / "clips" / f"{cache_key}.mp4"
             if not cached_file.exists():
                 # Clean up stale metadata entry
-                del cls._metadata["entries"][cache_key]
+                cls._drop_entry(cache_key)
                 stats = cls._metadata.setdefault("stats", {})
                 stats["misses"] = stats.get("misses", 0) + 1
+                cls._start_miss_timer(primary_key)
                 cls._save_metadata()
                 return None
             
@@ -239,6 +430,7 @@ class FFmpegCache:
             stats["hits"] = stats.get("hits", 0) + 1
             
             # Update access time for the entry
+            cls._record_access(cache_key)
             try:
                 cls._metadata["entries"][cache_key]["last_accessed"] = cached_file.stat().st_mtime
             except OSError:
@@ -263,14 +455,19 @@ class FFmpegCache:
             # Stat once and reuse for all metadata fields
             st = cached_file.stat()
             with cls._lock:
+                cls._drop_entry(cache_key)  # Replacing an entry - don't double count
+                cls._total_bytes += st.st_size
                 cls._metadata["entries"][cache_key] = {
                     "type": "clip",
                     "input_path": str(input_path),
                     "params": params,
                     "created": st.st_mtime,
                     "last_accessed": st.st_mtime,
+                    "last_access_ts": time.time(),
+                    "miss_cost_s": cls._stop_miss_timer(cache_key),
                     "size": st.st_size
                 }
+                cls._enforce_size_limit()
                 cls._save_metadata()
             
             return cached_file
@@ -303,15 +500,17 @@ class FFmpegCache:
             else:
                 stats = cls._metadata.setdefault("stats", {})
                 stats["misses"] = stats.get("misses", 0) + 1
+                cls._start_miss_timer(primary_key)
                 return None
 
             # Check if cached file actually exists
             cached_file = cls._cache_dir / "frames" / f"{cache_key}.png"
             if not cached_file.exists():
                 # Clean up stale metadata entry
-                del cls._metadata["entries"][cache_key]
+                cls._drop_entry(cache_key)
                 stats = cls._metadata.setdefault("stats", {})
                 stats["misses"] = stats.get("misses", 0) + 1
+                cls._start_miss_timer(primary_key)
                 cls._save_metadata()
                 return None
             
@@ -320,6 +519,7 @@ class FFmpegCache:
             stats["hits"] = stats.get("hits", 0) + 1
             
             # Update access time for the entry
+            cls._record_access(cache_key)
             try:
                 cls._metadata["entries"][cache_key]["last_accessed"] = cached_file.stat().st_mtime
             except OSError:
@@ -344,14 +544,19 @@ class FFmpegCache:
             # Stat once and reuse for all metadata fields
             st = cached_file.stat()
             with cls._lock:
+                cls._drop_entry(cache_key)  # Replacing an entry - don't double count
+                cls._total_bytes += st.st_size
                 cls._metadata["entries"][cache_key] = {
                     "type": "frame",
                     "input_path": str(input_path),
                     "params": params,
                     "created": st.st_mtime,
                     "last_accessed": st.st_mtime,
+                    "last_access_ts": time.time(),
+                    "miss_cost_s": cls._stop_miss_timer(cache_key),
                     "size": st.st_size
                 }
+                cls._enforce_size_limit()
                 cls._save_metadata()
             
             return cached_file
@@ -402,17 +607,8 @@ class FFmpegCache:
         return False
     
     @classmethod
-    def get_cache_entries_with_sources(cls) -> Dict[str, Any]:
-        """Get cache entries mapped to their source files for better visibility. Automatically configures cache if needed."""
-        cls.auto_configure()
-        
-        if not cls._cache_dir:
-            return {"enabled": False, "entries": []}
-        
-        entries = cls._metadata.get("entries", {})
-        mapped_entries = []
-        
-        # First pass: collect all slides and build a sequence map
+    def _build_slide_sequence(cls, entries: Dict[str, Any]) -> Dict[str, int]:
+        """Map rendered slide source paths to their chronological position."""
         slide_operations = ["photo_slide_render", "video_slide_render", "multi_slide_render"]
         slides_by_source = {}  # Maps source path to (mtime, sequence_index)
         
@@ -432,114 +628,147 @@ class FFmpegCache:
         # Sort slides by mtime to get chronological sequence
         sorted_slides = sorted(slides_by_source.items(), key=lambda x: x[1])
         slide_sequence = {path: idx for idx, (path, mtime) in enumerate(sorted_slides)}
+        return slide_sequence
+
+    @classmethod
+    def _map_cache_entry(cls, cache_key: str, entry: Dict[str, Any], slide_sequence: Dict[str, int]) -> Dict[str, Any]:
+        """Describe one metadata entry with its source file and sequence position."""
+        slide_operations = ["photo_slide_render", "video_slide_render", "multi_slide_render"]
+        source_path = Path(entry.get("input_path", "Unknown"))
+        operation = entry.get("params", {}).get("operation", "unknown")
+        entry_type = entry.get("type", "unknown")
+        size_mb = entry.get("size", 0) / (1024 * 1024)
         
-        # Second pass: build mapped entries with sequence info
-        for cache_key, entry in entries.items():
-            source_path = Path(entry.get("input_path", "Unknown"))
-            operation = entry.get("params", {}).get("operation", "unknown")
-            entry_type = entry.get("type", "unknown")
-            size_mb = entry.get("size", 0) / (1024 * 1024)
+        # Get the cached file path
+        if entry_type == "clip":
+            cached_file = cls._cache_dir / "clips" / f"{cache_key}.mp4"
+        elif entry_type == "frame":
+            cached_file = cls._cache_dir / "frames" / f"{cache_key}.png"
+        else:
+            cached_file = None
+        
+        # Determine sequence position
+        sequence_pos = 999999  # Default for unknown
+        sequence_sub = 0  # 0 for slides, 1 for transitions, 2 for frames
+        
+        if operation == "intro_title_render":
+            sequence_pos = -1  # Intro comes first - but exclude from slide browsing
+            sequence_sub = 3  # Use 3 to separate from slides (0), transitions (1), frames (2)
+        elif operation in slide_operations:
+            # Regular slide - use its position in the sorted list
+            source_key = str(source_path.absolute())
+            sequence_pos = slide_sequence.get(source_key, 999999)
+        elif operation == "extract_frame":
+            # Frame extraction - match to source slide by filename
+            # input_path is like "/path/to/IMG_6653_1c397474.mp4" (rendered clip)
+            # Extract base name without hash: IMG_6653
+            source_name = source_path.stem  # e.g., "IMG_6653_1c397474"
             
-            # Get the cached file path
-            if entry_type == "clip":
-                cached_file = cls._cache_dir / "clips" / f"{cache_key}.mp4"
-            elif entry_type == "frame":
-                cached_file = cls._cache_dir / "frames" / f"{cache_key}.png"
-            else:
-                cached_file = None
-            
-            # Determine sequence position
-            sequence_pos = 999999  # Default for unknown
-            sequence_sub = 0  # 0 for slides, 1 for transitions, 2 for frames
-            
-            if operation == "intro_title_render":
-                sequence_pos = -1  # Intro comes first - but exclude from slide browsing
-                sequence_sub = 3  # Use 3 to separate from slides (0), transitions (1), frames (2)
-            elif operation in slide_operations:
-                # Regular slide - use its position in the sorted list
-                source_key = str(source_path.absolute())
-                sequence_pos = slide_sequence.get(source_key, 999999)
-            elif operation == "extract_frame":
-                # Frame extraction - match to source slide by filename
-                # input_path is like "/path/to/IMG_6653_1c397474.mp4" (rendered clip)
-                # Extract base name without hash: IMG_6653
-                source_name = source_path.stem  # e.g., "IMG_6653_1c397474"
-                
-                # Remove hash suffix - find the last underscore followed by hex chars
-                # IMG_6653_1c397474 -> IMG_6653
-                # IMG_6659 -> IMG_6659 (no hash)
-                if '_' in source_name:
-                    # Split and check if last part looks like a hash (8 hex chars)
-                    parts = source_name.rsplit('_', 1)
-                    if len(parts) == 2 and len(parts[1]) == 8 and all(c in '0123456789abcdef' for c in parts[1]):
-                        base_name = parts[0]
-                    else:
-                        base_name = source_name
+            # Remove hash suffix - find the last underscore followed by hex chars
+            # IMG_6653_1c397474 -> IMG_6653
+            # IMG_6659 -> IMG_6659 (no hash)
+            if '_' in source_name:
+                # Split and check if last part looks like a hash (8 hex chars)
+                parts = source_name.rsplit('_', 1)
+                if len(parts) == 2 and len(parts[1]) == 8 and all(c in '0123456789abcdef' for c in parts[1]):
+                    base_name = parts[0]
                 else:
                     base_name = source_name
-                
-                # Find matching slide in sequence by exact filename match
+            else:
+                base_name = source_name
+            
+            # Find matching slide in sequence by exact filename match
+            for slide_path, idx in slide_sequence.items():
+                slide_filename = Path(slide_path).stem
+                # Exact match on base name
+                if base_name == slide_filename:
+                    sequence_pos = idx
+                    sequence_sub = 2  # Frames sort after transitions for same slide
+                    break
+        elif operation in ["fade_transition", "origami_transition_render"]:
+            # Transition - figure out which slide it follows
+            # For fade transitions, check params
+            from_slide_path = entry.get("params", {}).get("from_slide", "")
+            from_slide_name = None
+            
+            if from_slide_path:
+                # Fade transition: from_slide contains path to rendered clip
+                from_slide_stem = Path(from_slide_path).stem
+                # Remove hash suffix if present (e.g., "IMG_3819_abc123" -> "IMG_3819")
+                from_slide_name = from_slide_stem.split('_')[0] if '_' in from_slide_stem else from_slide_stem
+            else:
+                # Origami transition: input_path is like "IMG_6653.HEIC (Duration: 3.00s)_to_IMG_6654.HEIC (Duration: 3.00s)"
+                input_path_str = entry.get("input_path", "")
+                if "_to_" in input_path_str:
+                    from_part = input_path_str.split("_to_")[0]
+                    # Extract just the filename (remove duration info)
+                    if " (Duration:" in from_part:
+                        from_slide_name = from_part.split(" (Duration:")[0]
+                    else:
+                        from_slide_name = from_part
+            
+            # Find matching slide in sequence
+            if from_slide_name:
                 for slide_path, idx in slide_sequence.items():
-                    slide_filename = Path(slide_path).stem
-                    # Exact match on base name
-                    if base_name == slide_filename:
+                    slide_filename = Path(slide_path).name
+                    if from_slide_name in slide_filename or slide_filename.startswith(from_slide_name):
                         sequence_pos = idx
-                        sequence_sub = 2  # Frames sort after transitions for same slide
+                        sequence_sub = 1  # Comes after the slide
                         break
-            elif operation in ["fade_transition", "origami_transition_render"]:
-                # Transition - figure out which slide it follows
-                # For fade transitions, check params
-                from_slide_path = entry.get("params", {}).get("from_slide", "")
-                from_slide_name = None
-                
-                if from_slide_path:
-                    # Fade transition: from_slide contains path to rendered clip
-                    from_slide_stem = Path(from_slide_path).stem
-                    # Remove hash suffix if present (e.g., "IMG_3819_abc123" -> "IMG_3819")
-                    from_slide_name = from_slide_stem.split('_')[0] if '_' in from_slide_stem else from_slide_stem
-                else:
-                    # Origami transition: input_path is like "IMG_6653.HEIC (Duration: 3.00s)_to_IMG_6654.HEIC (Duration: 3.00s)"
-                    input_path_str = entry.get("input_path", "")
-                    if "_to_" in input_path_str:
-                        from_part = input_path_str.split("_to_")[0]
-                        # Extract just the filename (remove duration info)
-                        if " (Duration:" in from_part:
-                            from_slide_name = from_part.split(" (Duration:")[0]
-                        else:
-                            from_slide_name = from_part
-                
-                # Find matching slide in sequence
-                if from_slide_name:
-                    for slide_path, idx in slide_sequence.items():
-                        slide_filename = Path(slide_path).name
-                        if from_slide_name in slide_filename or slide_filename.startswith(from_slide_name):
-                            sequence_pos = idx
-                            sequence_sub = 1  # Comes after the slide
-                            break
-            
-            # Get cached file modification time for frames (used for sorting)
-            cached_file_mtime = 0
-            if cached_file and cached_file.exists():
-                try:
-                    cached_file_mtime = cached_file.stat().st_mtime
-                except (OSError, IOError):
-                    pass
-            
-            mapped_entries.append({
-                "cache_key": cache_key,
-                "source_file": source_path.name,
-                "source_path": str(source_path),
-                "operation": operation,
-                "type": entry_type,
-                "size_mb": round(size_mb, 2),
-                "cached_file": str(cached_file) if cached_file else "Unknown",
-                "params": entry.get("params", {}),
-                "created": entry.get("created", 0),
-                "last_accessed": entry.get("last_accessed", entry.get("created", 0)),
-                "sequence_pos": sequence_pos,
-                "sequence_sub": sequence_sub,
-                "cached_file_mtime": cached_file_mtime
-            })
+        
+        # Get cached file modification time for frames (used for sorting)
+        cached_file_mtime = 0
+        if cached_file and cached_file.exists():
+            try:
+                cached_file_mtime = cached_file.stat().st_mtime
+            except (OSError, IOError):
+                pass
+        
+        return {
+            "cache_key": cache_key,
+            "source_file": source_path.name,
+            "source_path": str(source_path),
+            "operation": operation,
+            "type": entry_type,
+            "size_mb": round(size_mb, 2),
+            "cached_file": str(cached_file) if cached_file else "Unknown",
+            "params": entry.get("params", {}),
+            "created": entry.get("created", 0),
+            "last_accessed": entry.get("last_accessed", entry.get("created", 0)),
+            "sequence_pos": sequence_pos,
+            "sequence_sub": sequence_sub,
+            "cached_file_mtime": cached_file_mtime
+        }
+
+    @classmethod
+    def iter_cache_entries_with_sources(cls) -> Iterator[Dict[str, Any]]:
+        """
+        Yield cache entries mapped to their source files one at a time, unsorted.
+        Automatically configures cache if needed.
+        
+        Use this instead of get_cache_entries_with_sources() when the caller
+        doesn't need the sorted clip/frame lists, so large caches are walked
+        without building a full entries list.
+        """
+        cls.auto_configure()
+        
+        if not cls._cache_dir:
+            return
+        
+        entries = cls._metadata.get("entries", {})
+        slide_sequence = cls._build_slide_sequence(entries)
+        for cache_key, entry in entries.items():
+            yield cls._map_cache_entry(cache_key, entry, slide_sequence)
+
+    @classmethod
+    def get_cache_entries_with_sources(cls) -> Dict[str, Any]:
+        """Get cache entries mapped to their source files for better visibility. Automatically configures cache if needed."""
+        cls.auto_configure()
+        
+        if not cls._cache_dir:
+            return {"enabled": False, "entries": []}
+        
+        mapped_entries = list(cls.iter_cache_entries_with_sources())
         
         # Separate clips and frames for different sorting strategies
         clips = [e for e in mapped_entries if e["type"] == "clip" and e["operation"] != "intro_title_render"]  # Exclude intro titles from browser
@@ -605,9 +834,41 @@ class FFmpegCache:
             "cache_misses": stats.get("misses", 0),
             "hit_rate_percent": round(hit_rate, 1),
             "total_requests": total_requests,
+            "evicted_mb": stats.get("evicted_bytes", 0) / (1024 * 1024),
             "operations": operation_counts
         }
     
+    @classmethod
+    def scan_cache_files(cls, subdir: str) -> Tuple[List[str], List[int]]:
+        """
+        List the files actually on disk in a cache subdirectory.
+        
+        Uses os.scandir so each size comes from the directory listing's
+        stat data without building a Path per file.
+        
+        Args:
+            subdir: Cache subdirectory ("clips", "frames" or "temp")
+            
+        Returns:
+            Parallel lists (names, sizes_in_bytes); empty if the directory is missing
+        """
+        names, sizes = [], []
+        if not cls._cache_dir:
+            return names, sizes
+        
+        try:
+            with os.scandir(cls._cache_dir / subdir) as it:
+                for entry in it:
+                    try:
+                        size = entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    names.append(entry.name)
+                    sizes.append(size)
+        except OSError:
+            pass
+        return names, sizes
+    
     @classmethod
     def enable(cls, enabled: bool = True):
         """Enable or disable caching."""
@@ -666,8 +927,7 @@ class FFmpegCache:
         
         # Remove metadata entries
         for cache_key in entries_to_remove:
-            if cache_key in cls._metadata.get("entries", {}):
-                del cls._metadata["entries"][cache_key]
+            cls._drop_entry(cache_key)
         
         if entries_to_remove:
             cls._save_metadata()
@@ -681,7 +941,6 @@ class FFmpegCache:
         if not cls._cache_dir:
             return
             
-        import time
         cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
         entries_to_remove = []
         
@@ -702,8 +961,7 @@ class FFmpegCache:
         
         # Remove metadata entries
         for cache_key in entries_to_remove:
-            if cache_key in cls._metadata.get("entries", {}):
-                del cls._metadata["entries"][cache_key]
+            cls._drop_entry(cache_key)
         
         if entries_to_remove:
             cls._save_metadata()
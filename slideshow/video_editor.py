@@ -75,11 +75,10 @@ class SlideshowMetadata:
     def load(cls, video_path: Path) -> Optional['SlideshowMetadata']:
         """Load metadata from JSON file."""
         metadata_path = video_path.with_suffix('.metadata.json')
-        if not metadata_path.exists():
+        try:
+            data = json.loads(metadata_path.read_bytes())
+        except FileNotFoundError:
             return None
-            
-        with open(metadata_path, 'r') as f:
-            data = json.load(f)
         
         metadata = cls(Path(data['video_path']))
         metadata.total_duration = data['total_duration']
@@ -16,7 +16,7 @@ import pytest
 # Add the slideshow module to Python path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from slideshow.config import Config
+from slideshow.config import Config, AppSettings, clear_config_cache
 
 
 @pytest.fixture(scope="session")
@@ -58,11 +58,14 @@ def clean_config():
     """Ensure Config singleton is clean for each test."""
     # Clear any existing instance
     Config._instance = None
+    AppSettings._instance = None
+    clear_config_cache()
     yield
     # Clean up after test
     if Config._instance:
         Config._instance.clear()
         Config._instance = None
+    AppSettings._instance = None
 
 
 @pytest.fixture
@@ -61,4 +61,70 @@ class TestBasicCacheFunctionality:
         # Different params should give different key
         assert key1 != key3
         assert isinstance(key1, str)
-        assert len(key1) > 0
\ No newline at end of file
+        assert len(key1) > 0
+
+class TestCacheEviction:
+    """Test size-capped eviction of cache entries."""
+    
+    def test_lrbu_evicts_cheap_idle_entries_first(self, temp_project_dir):
+        """Test that entries which were cheap to render are evicted before costly ones."""
+        cache_dir = temp_project_dir / "cache"
+        FFmpegCache.configure(cache_dir)
+        
+        entries = FFmpegCache._metadata["entries"]
+        entries.clear()
+        last_access = time.time() - 60
+        for cache_key, miss_cost in (("cheap", 0.1), ("costly", 10.0)):
+            (cache_dir / "frames" / f"{cache_key}.png").write_bytes(b"x" * 100)
+            entries[cache_key] = {
+                "type": "frame",
+                "size": 100,
+                "last_access_ts": last_access,
+                "miss_cost_s": miss_cost,
+            }
+        
+        evicted = FFmpegCache._evict_lrbu(100)
+        
+        assert evicted == 100
+        assert "costly" in entries
+        assert "cheap" not in entries
+        assert not (cache_dir / "frames" / "cheap.png").exists()
+        assert FFmpegCache.get_cache_stats()["evicted_mb"] > 0
+    
+    def test_store_evicts_when_over_cap(self, temp_project_dir):
+        """Test that storing past the size cap evicts down below it."""
+        cache_dir = temp_project_dir / "cache"
+        FFmpegCache.initialize(cache_dir, max_bytes=150)
+        for i in range(3):
+            frame = temp_project_dir / f"frame{i}.png"
+            frame.write_bytes(b"x" * 100)
+            FFmpegCache.store_frame(frame, {"index": i}, frame)
+        
+        assert FFmpegCache._total_bytes <= 150
+        assert len(FFmpegCache._metadata["entries"]) == 1
+    
+    def test_cap_dropped_on_new_directory(self, temp_project_dir):
+        """Test that a cap from initialize() doesn't carry over to another cache directory."""
+        FFmpegCache.initialize(temp_project_dir / "capped", max_bytes=150)
+        assert FFmpegCache._max_bytes == 150
+        
+        FFmpegCache.configure(temp_project_dir / "uncapped")
+        assert FFmpegCache._max_bytes is None
+    
+    def test_access_log_compacted_on_configure(self, temp_project_dir):
+        """Test that cache hits logged to access_log.jsonl are folded into metadata."""
+        cache_dir = temp_project_dir / "cache"
+        FFmpegCache.configure(cache_dir)
+        frame = temp_project_dir / "frame.png"
+        frame.write_bytes(b"x" * 10)
+        FFmpegCache.store_frame(frame, {"index": 0}, frame)
+        assert FFmpegCache.get_cached_frame(frame, {"index": 0}) is not None
+        logged = json.loads((cache_dir / "access_log.jsonl").read_text().splitlines()[-1])
+        
+        # Reconfigure from disk
+        FFmpegCache.configure(temp_project_dir / "other_cache")
+        FFmpegCache.configure(cache_dir)
+        
+        assert not (cache_dir / "access_log.jsonl").exists()
+        assert FFmpegCache._metadata["entries"][logged["key"]]["last_access_ts"] == logged["ts"]
+        assert FFmpegCache._total_bytes == 10
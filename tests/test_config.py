@@ -10,7 +10,7 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
-from slideshow.config import Config
+from slideshow.config import Config, AppSettings, ConfigStore, flush_config_writes, get_ffmpeg_encoding_params
 from tests.conftest import TestHelpers
 
 
@@ -31,6 +31,14 @@ class TestConfigSingleton:
         # Now direct instantiation should fail
         with pytest.raises(RuntimeError, match="Use Config.instance()"):
             Config()
+    
+    def test_encoding_params_with_explicit_config(self, clean_config):
+        """Test that the config= wrapper works without creating a second singleton."""
+        instance = Config.instance()
+        params = get_ffmpeg_encoding_params(config={"video_quality": "fast"})
+        
+        assert params[params.index("-preset") + 1] == "fast"
+        assert Config.instance() is instance
 
 
 class TestInputValidation:
@@ -260,8 +268,9 @@ class TestConfigPersistence:
         
         output_folder = str(temp_project_dir / "output")
         
-        # Save config
+        # Save config (writes are debounced, so flush before checking the file)
         config.save(output_folder)
+        flush_config_writes()
         
         # Verify file was created
         config_file = temp_project_dir / "slideshow_config.json"
@@ -276,6 +285,19 @@ class TestConfigPersistence:
         assert loaded_config["fps"] == sample_config["fps"]
         assert loaded_config["resolution"] == sample_config["resolution"]
     
+    def test_save_fills_missing_keys_from_defaults(self, clean_config, temp_project_dir):
+        """Test that saving a partial config writes every default key."""
+        config = Config.instance()
+        config.set({"fps": 24})
+        
+        config.save(str(temp_project_dir / "output"))
+        flush_config_writes()
+        
+        saved = json.loads((temp_project_dir / "slideshow_config.json").read_text())
+        assert saved["fps"] == 24
+        assert saved["intro_title"] == Config.DEFAULT_CONFIG["intro_title"]
+        assert saved.keys() == Config.DEFAULT_CONFIG.keys()
+    
     def test_load_nonexistent_uses_defaults(self, clean_config, temp_project_dir):
         """Test that loading from non-existent path uses defaults."""
         config = Config.instance()
@@ -297,4 +319,133 @@ class TestConfigPersistence:
         result = config.load(output_folder)
         
         # Should fall back to defaults
-        assert result == Config.DEFAULT_CONFIG
\ No newline at end of file
+        assert result == Config.DEFAULT_CONFIG
+    
+    def test_load_picks_up_external_changes(self, clean_config, temp_project_dir):
+        """Test that cached config parses are invalidated when the file changes."""
+        config = Config.instance()
+        config_file = temp_project_dir / "slideshow_config.json"
+        output_folder = str(temp_project_dir / "output")
+        
+        config_file.write_text(json.dumps({"fps": 24}))
+        assert config.load(output_folder)["fps"] == 24
+        
+        # Mutating the returned dict must not leak into the cache
+        config.load(output_folder)["fps"] = 99
+        assert config.load(output_folder)["fps"] == 24
+        
+        config_file.write_text(json.dumps({"fps": 60, "photo_duration": 4.0}))
+        result = config.load(output_folder)
+        assert result["fps"] == 60
+        assert result["photo_duration"] == 4.0
+    
+    def test_loaded_defaults_do_not_alias_nested_values(self, clean_config, temp_project_dir):
+        """Test that mutating a loaded config never changes DEFAULT_CONFIG."""
+        config = Config.instance()
+        result = config.load(str(temp_project_dir / "nonexistent" / "output"))
+        
+        result["intro_title"]["text"] = "Changed"
+        result["intro_title"]["text_color"][0] = 0
+        
+        assert Config.DEFAULT_CONFIG["intro_title"]["text"] == ""
+        assert Config.DEFAULT_CONFIG["intro_title"]["text_color"][0] == 255
+    
+    def test_defaults_are_read_only(self, clean_config):
+        """Test that the shared default templates cannot be modified in place."""
+        with pytest.raises(TypeError):
+            Config.DEFAULT_CONFIG["fps"] = 60
+        with pytest.raises(TypeError):
+            Config.DEFAULT_APP_SETTINGS["last_project_path"] = "/tmp"
+
+
+
+class TestConfigStore:
+    """Test the shared JSON store behind Config and AppSettings."""
+    
+    def test_load_sees_queued_save(self, clean_config, temp_project_dir):
+        """Test that a load right after save returns the queued data."""
+        path = temp_project_dir / "store.json"
+        ConfigStore.save(path, {"fps": 24})
+        ConfigStore.save(path, {"fps": 30})
+        
+        assert ConfigStore.load(path) == {"fps": 30}
+        assert not path.with_suffix(".json.tmp").exists()
+    
+    def test_load_returns_independent_copies(self, clean_config, temp_project_dir):
+        """Test that mutating a cached load does not leak into the next one."""
+        path = temp_project_dir / "store.json"
+        path.write_text(json.dumps({"history": [1, 2]}))
+        
+        ConfigStore.load(path)["history"].append(3)
+        assert ConfigStore.load(path) == {"history": [1, 2]}
+    
+    def test_load_after_flush_skips_read(self, clean_config, temp_project_dir):
+        """Test that a flushed save leaves the parse cache warm."""
+        path = temp_project_dir / "store.json"
+        ConfigStore.save(path, {"last_project_path": "/p/a"})
+        flush_config_writes()
+        
+        with patch("builtins.open", side_effect=AssertionError("file was re-read")):
+            assert ConfigStore.load(path) == {"last_project_path": "/p/a"}
+    
+    def test_load_large_file_via_mmap(self, clean_config, temp_project_dir):
+        """Test that files above the mmap threshold parse the same way."""
+        path = temp_project_dir / "store.json"
+        data = {"project_history": [{"name": f"Project {i}", "path": f"/p/{i}"} for i in range(500)]}
+        path.write_text(json.dumps(data))
+        assert path.stat().st_size > ConfigStore.MMAP_THRESHOLD_BYTES
+        
+        assert ConfigStore.load(path) == data
+    
+    def test_stdlib_writer_keeps_utf8(self, clean_config, temp_project_dir, monkeypatch):
+        """Test that the json fallback writes raw UTF-8 like orjson does."""
+        import slideshow.config as config_module
+        monkeypatch.setattr(config_module, "orjson", None)
+        path = temp_project_dir / "store.json"
+        ConfigStore.save(path, {"project_name": "Café", "fps": 30})
+        flush_config_writes()
+        
+        text = path.read_text(encoding="utf-8")
+        assert '"project_name": "Café"' in text
+        assert text.index('"fps"') < text.index('"project_name"')
+        assert json.loads(text) == {"project_name": "Café", "fps": 30}
+
+
+class TestAppSettings:
+    """Test app settings and project history."""
+    
+    @pytest.fixture
+    def settings_file(self, clean_config, temp_project_dir, monkeypatch):
+        """Point app settings at a temporary file."""
+        settings_file = temp_project_dir / "slideshow_settings.json"
+        monkeypatch.setattr(Config, "APP_SETTINGS_FILE", settings_file)
+        yield settings_file
+        flush_config_writes()
+    
+    def test_project_history_moves_to_front(self, settings_file):
+        """Test that re-adding a project moves it to the front without duplicates."""
+        config = Config.instance()
+        for name in ["A", "B", "C", "A"]:
+            config.add_to_project_history(name, f"/projects/{name}")
+        
+        assert config.get_project_history_names() == ["A", "C", "B"]
+    
+    def test_project_history_normalizes_and_caps(self, settings_file):
+        """Test that legacy string entries are read and history is capped at 10."""
+        AppSettings.instance().set("project_history", ["Old", {"name": "New", "path": "/p/New"}, "Old"])
+        config = Config.instance()
+        assert config.get_project_history() == [{"name": "Old", "path": ""}, {"name": "New", "path": "/p/New"}]
+        
+        for i in range(12):
+            config.add_to_project_history(f"P{i}")
+        names = config.get_project_history_names()
+        assert names == [f"P{i}" for i in range(11, 1, -1)]
+    
+    def test_project_history_persists(self, settings_file):
+        """Test that history is written to disk and re-read by a fresh AppSettings."""
+        Config.instance().add_to_project_history("Holiday", "/projects/Holiday")
+        flush_config_writes()
+        
+        AppSettings._instance = None
+        assert json.loads(settings_file.read_text())["project_history"][0]["name"] == "Holiday"
+        assert Config.instance().get_project_history()[0] == {"name": "Holiday", "path": "/projects/Holiday"}
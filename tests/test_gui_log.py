@@ -0,0 +1,129 @@
+"""
+Unit tests for the main window's log panel buffering.
+
+The GUI is created without running Tk's __init__ (no display is needed); the
+log Text widget is replaced by a small stand-in that keeps its content as a
+string and understands the few index forms _flush_log uses.
+"""
+
+from collections import deque
+
+import pytest
+
+from slideshow.gui.main_window import GUI
+
+
+def text_lines(text):
+    """Split text into lines the way a Tk Text widget does: on "\n" only."""
+    return [line + "\n" for line in text.split("\n")[:-1]]
+
+
+class FakeLogText:
+    """Minimal stand-in for the log tk.Text widget."""
+    
+    def __init__(self):
+        self.content = ""
+    
+    def insert(self, index, text):
+        assert index == "end"
+        self.content += text
+    
+    def replace(self, start, end, text):
+        assert (start, end) == ("end-2l", "end-1l")
+        lines = text_lines(self.content)
+        self.content = "".join(lines[:-1]) + text
+    
+    def delete(self, start, end):
+        assert start == "1.0" and end.endswith(".0")
+        drop = int(end[:-2]) - 1
+        self.content = "".join(text_lines(self.content)[drop:])
+    
+    def yview(self):
+        return (0.0, 1.0)
+    
+    def see(self, index):
+        pass
+    
+    def configure(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def gui():
+    """GUI object with just the state the logging methods use."""
+    window = GUI.__new__(GUI)
+    window._log_buf = deque()
+    window._log_mirror = deque(maxlen=GUI.MAX_LOG_LINES)
+    window._log_editable_depth = 0
+    window._last_status = None
+    window.log_text = FakeLogText()
+    return window
+
+
+def panel_lines(window):
+    """Log panel text lines without their timestamps."""
+    return [line.split("] ", 1)[1].rstrip("\n") for line in text_lines(window.log_text.content)]
+
+
+class TestLogStatus:
+    """Test status lines written through update_status and the '\\r' marker."""
+    
+    def test_first_status_keeps_previous_line(self, gui):
+        """The first status gets its own line; later ones overwrite it."""
+        gui.log_message("Loading slides...")
+        gui.update_status("Scanning 3 media files...")
+        gui._flush_log()
+        assert panel_lines(gui) == ["Loading slides...", "Scanning 3 media files..."]
+        
+        gui.update_status("Loaded 2/3 files...")
+        gui._flush_log()
+        assert panel_lines(gui) == ["Loading slides...", "Loaded 2/3 files..."]
+    
+    def test_carriage_return_routes_to_status(self, gui):
+        """log_message treats a trailing '\\r' as a status update."""
+        gui.log_message("Rendering")
+        gui.log_message("Step 1\r")
+        gui.log_message("Step 2\r")
+        gui.log_message("Done")
+        gui._flush_log()
+        assert panel_lines(gui) == ["Rendering", "Step 2", "Done"]
+
+
+class TestLogMirror:
+    """Test that the Copy All mirror matches the panel text."""
+    
+    def test_multiline_entry_then_status(self, gui):
+        """A status overwrite after a multi-line entry replaces only its last line."""
+        gui.log_message("Rendering photo slide\n  Original size: 10x10")
+        gui._flush_log()
+        gui._last_status = "previous status"  # Next status overwrites the last line
+        gui.update_status("Rendering transitions (1/2)...")
+        gui._flush_log()
+        assert "".join(gui._log_mirror) == gui.log_text.content
+    
+    def test_cap_counts_text_lines(self, gui, monkeypatch):
+        """The line cap applies to text lines, not log entries."""
+        monkeypatch.setattr(GUI, "MAX_LOG_LINES", 5)
+        gui._log_mirror = deque(maxlen=5)
+        for i in range(4):
+            gui.log_message(f"entry {i}\n  detail {i}")
+            gui._flush_log()
+        assert len(text_lines(gui.log_text.content)) == 5
+        assert "".join(gui._log_mirror) == gui.log_text.content
+    
+    def test_embedded_carriage_return(self, gui, monkeypatch):
+        """A '\r' inside an entry is not a line break for the mirror or the cap."""
+        monkeypatch.setattr(GUI, "MAX_LOG_LINES", 3)
+        gui._log_mirror = deque(maxlen=3)
+        gui.log_message("frame=1\rframe=2 done")
+        gui.log_message("second")
+        gui._flush_log()
+        assert len(gui._log_mirror) == len(text_lines(gui.log_text.content)) == 2
+        
+        gui._last_status = "previous status"  # Next status overwrites the last line
+        gui.update_status("status")
+        gui.log_message("third")
+        gui.log_message("fourth")
+        gui._flush_log()
+        assert "".join(gui._log_mirror) == gui.log_text.content
+        assert len(gui._log_mirror) == len(text_lines(gui.log_text.content)) == 3